@@ -11,7 +11,6 @@ Dependencies:
 """
 
 import argparse
-import json
 import logging
 import sys
 from datetime import datetime
@@ -24,7 +23,7 @@ sys.path.insert(0, str(src_dir))
 
 try:
     from heatsense.config.settings import UHI_PERFORMANCE_MODES
-    from heatsense.webapp.analysis_backend import UHIAnalysisBackend
+    from heatsense.webapp.analysis_backend import UHIAnalysisBackend, dumps_analysis_result
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("💡 Install dependencies with:")
@@ -107,14 +106,18 @@ def save_geojson_outputs(result_data: dict, analysis_id: str, output_dir: Path)
         if data_key in result_data and "geojson" in result_data[data_key]:
             output_path = output_dir / f"{analysis_id}_{filename_suffix}.geojson"
             with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result_data[data_key]["geojson"], f, indent=2, ensure_ascii=False)
+                f.write(
+                    dumps_analysis_result(
+                        result_data[data_key]["geojson"], indent=2, ensure_ascii=False
+                    )
+                )
             print(f"   {description}: {output_path}")
 
     # Save boundary data if available
     if "boundary" in result_data:
         boundary_path = output_dir / f"{analysis_id}_boundary.geojson"
         with open(boundary_path, "w", encoding="utf-8") as f:
-            json.dump(result_data["boundary"], f, indent=2, ensure_ascii=False)
+            f.write(dumps_analysis_result(result_data["boundary"], indent=2, ensure_ascii=False))
         print(f"   🗺️ Boundary: {boundary_path}")
 
 
@@ -196,7 +199,7 @@ def main():
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+                f.write(dumps_analysis_result(result, indent=2, ensure_ascii=False))
 
             print(f"✅ Results saved to: {output_path}")
         else:
@@ -206,7 +209,7 @@ def main():
 
             default_output = temp_dir / f"{analysis_id}_result.json"
             with open(default_output, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+                f.write(dumps_analysis_result(result, indent=2, ensure_ascii=False))
 
             print(f"✅ Results saved to: {default_output}")
 
@@ -13,7 +13,9 @@ from .settings import (
     CRS_CONFIG,
     DWD_SETTINGS,
     DWD_TEMPERATURE_PARAMETERS,
+    UHI_CACHE_DIR,
     UHI_EARTH_ENGINE_PROJECT,
+    UHI_EARTH_ENGINE_URL,
     UHI_LOG_DIR,
     UHI_LOG_LEVEL,
     UHI_PERFORMANCE_MODES,
@@ -27,7 +29,9 @@ __all__ = [
     "CORINE_YEARS",
     "DWD_SETTINGS",
     "DWD_TEMPERATURE_PARAMETERS",
+    "UHI_CACHE_DIR",
     "UHI_EARTH_ENGINE_PROJECT",
+    "UHI_EARTH_ENGINE_URL",
     "UHI_LOG_DIR",
     "UHI_LOG_LEVEL",
     "UHI_PERFORMANCE_MODES",
@@ -104,5 +104,9 @@ UHI_PERFORMANCE_MODES = {
 
 # External service configuration from environment variables
 UHI_EARTH_ENGINE_PROJECT = os.getenv("UHI_EARTH_ENGINE_PROJECT", "your-gee-project-id")
+UHI_EARTH_ENGINE_URL = os.getenv(
+    "UHI_EARTH_ENGINE_URL", "https://earthengine-highvolume.googleapis.com"
+)
 UHI_LOG_DIR = Path("logs")
+UHI_CACHE_DIR = Path(os.getenv("UHI_CACHE_DIR", "cache"))
 UHI_LOG_LEVEL = os.getenv("UHI_LOG_LEVEL", "INFO")
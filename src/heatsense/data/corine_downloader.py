@@ -34,6 +34,8 @@ class CorineDataDownloader:
         log_file: Optional path for detailed logging
         corine_years: Available CORINE dataset years (from settings)
         corine_base_urls: Service URLs by year (from settings)
+        session: Optional shared HTTP session, so pooled connections are reused
+            across downloader instances
     """
 
     def __init__(
@@ -45,11 +47,13 @@ class CorineDataDownloader:
         log_file: str | None = None,
         corine_years: list[int] = CORINE_YEARS,
         corine_base_urls: dict = CORINE_BASE_URLS,
+        session: requests.Session | None = None,
     ):
         self.record_count = record_count
         self.timeout = timeout
         self.corine_years = corine_years
         self.corine_base_urls = corine_base_urls
+        self._session = session if session is not None else requests.Session()
         self.logger = self._setup_logger(log_file) if verbose or log_file else None
 
         # Parse and validate input period
@@ -234,7 +238,7 @@ class CorineDataDownloader:
             url = self.build_query_url(bbox, offset, target_crs)
 
             try:
-                response = requests.get(url, timeout=self.timeout)
+                response = self._session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 data = response.json()
 
@@ -6,16 +6,26 @@ German Weather Service using the wetterdienst library. Supports spatial bufferin
 temperature interpolation, and flexible geometry input formats.
 """
 
+import functools
+import hashlib
 import json
 import logging
+import math
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
-import pandas as pd
-from scipy.interpolate import griddata
+import polars as pl
+import shapely
+from numba import njit, prange
+from pyproj import Transformer
+from rasterio.transform import Affine, from_origin
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.spatial import Delaunay, cKDTree
 from shapely.geometry import MultiPolygon, Point, Polygon, shape
 from wetterdienst import Settings
 from wetterdienst.provider.dwd.observation import DwdObservationRequest
@@ -23,6 +33,118 @@ from wetterdienst.provider.dwd.observation import DwdObservationRequest
 from ..config.settings import CRS_CONFIG, DWD_SETTINGS, DWD_TEMPERATURE_PARAMETERS
 
 
+@functools.lru_cache(maxsize=4)
+def _load_station_metadata(parameters: tuple[tuple[str, str, str], ...]) -> pl.DataFrame:
+    """Fetch the national DWD station list once per parameter set and reuse it."""
+    # Station listing only needs metadata, so no measurement period is requested
+    request = DwdObservationRequest(parameters=list(parameters), settings=Settings(**DWD_SETTINGS))
+    return request.all().df
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _scanline_mask(x_range: np.ndarray, y_range: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Mark grid nodes inside polygon rings using even-odd ray crossings per grid row."""
+    mask = np.zeros((y_range.shape[0], x_range.shape[0]), dtype=np.bool_)
+
+    for j in prange(y_range.shape[0]):
+        y = y_range[j]
+
+        # All nodes of a row share one horizontal ray, so edges are crossed once per row
+        crossings = np.empty(edges.shape[0])
+        n_crossings = 0
+        for e in range(edges.shape[0]):
+            x1, y1, x2, y2 = edges[e, 0], edges[e, 1], edges[e, 2], edges[e, 3]
+            if (y1 > y) != (y2 > y):
+                crossings[n_crossings] = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                n_crossings += 1
+        crossings = np.sort(crossings[:n_crossings])
+
+        # Nodes between consecutive crossing pairs have an odd crossing count
+        for k in range(0, n_crossings - 1, 2):
+            start = np.searchsorted(x_range, crossings[k])
+            stop = np.searchsorted(x_range, crossings[k + 1])
+            mask[j, start:stop] = True
+
+    return mask
+
+
+@functools.lru_cache(maxsize=8)
+def _build_grid_mask(
+    geometry_wkb: bytes, resolution: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute grid axes and the inside-geometry cell mask, memoized by WKB and resolution."""
+    geometry_projected = shapely.from_wkb(geometry_wkb)
+
+    # Generate grid coordinates from integer cell counts to avoid float drift in np.arange
+    min_x, min_y, max_x, max_y = geometry_projected.bounds
+    nx = int(np.floor((max_x - min_x) / resolution)) + 1
+    ny = int(np.floor((max_y - min_y) / resolution)) + 1
+    x_range = min_x + np.arange(nx) * resolution
+    y_range = min_y + np.arange(ny) * resolution
+
+    # Collect exterior and interior ring edges of all polygon parts as (x1, y1, x2, y2)
+    rings = shapely.get_rings(shapely.get_parts(geometry_projected))
+    coords, ring_index = shapely.get_coordinates(rings, return_index=True)
+    same_ring = ring_index[1:] == ring_index[:-1]
+    edges = np.column_stack((coords[:-1][same_ring], coords[1:][same_ring]))
+
+    # Test all grid nodes with the compiled ray-casting kernel; rows run south to north
+    if len(edges):
+        inside = _scanline_mask(x_range, y_range, edges)
+    else:
+        # Non-polygonal areas (e.g. a single point) have no rings to cast against
+        xx, yy = np.meshgrid(x_range, y_range)
+        inside = shapely.contains_xy(geometry_projected, xx, yy)
+
+    # Cached arrays are shared between callers, so guard them against mutation
+    for array in (x_range, y_range, inside):
+        array.flags.writeable = False
+
+    return x_range, y_range, inside
+
+
+@functools.lru_cache(maxsize=8)
+def _build_interpolation_grid(geometry_wkb: bytes, resolution: float) -> gpd.GeoDataFrame:
+    """Generate grid points inside a projected geometry, memoized by WKB and resolution."""
+    x_range, y_range, inside = _build_grid_mask(geometry_wkb, resolution)
+    xx, yy = np.meshgrid(x_range, y_range)
+
+    # Create GeoDataFrame and transform back to output CRS
+    return gpd.GeoDataFrame(
+        geometry=gpd.points_from_xy(xx[inside], yy[inside]), crs=CRS_CONFIG["PROCESSING"]
+    ).to_crs(CRS_CONFIG["OUTPUT"])
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _barycentric_interpolate(
+    points: np.ndarray,
+    simplex_ids: np.ndarray,
+    simplices: np.ndarray,
+    transforms: np.ndarray,
+    values: np.ndarray,
+) -> np.ndarray:
+    """Linearly interpolate values at points from their enclosing Delaunay triangles."""
+    result = np.empty(points.shape[0], dtype=values.dtype)
+
+    for i in prange(points.shape[0]):
+        simplex = simplex_ids[i]
+        if simplex < 0:
+            result[i] = np.nan
+            continue
+
+        # Barycentric weights from the affine transform precomputed by Qhull
+        dx = points[i, 0] - transforms[simplex, 2, 0]
+        dy = points[i, 1] - transforms[simplex, 2, 1]
+        w0 = transforms[simplex, 0, 0] * dx + transforms[simplex, 0, 1] * dy
+        w1 = transforms[simplex, 1, 0] * dx + transforms[simplex, 1, 1] * dy
+        w2 = 1.0 - w0 - w1
+
+        vertices = simplices[simplex]
+        result[i] = w0 * values[vertices[0]] + w1 * values[vertices[1]] + w2 * values[vertices[2]]
+
+    return result
+
+
 class DWDDataDownloader:
     """
     Download and process German Weather Service meteorological data.
@@ -36,6 +158,8 @@ class DWDDataDownloader:
         interpolation_method: Spatial interpolation algorithm (linear/nearest/cubic)
         interpolate_by_default: Enable automatic temperature interpolation
         interpolation_resolution: Grid cell size for interpolation in meters
+        cache_dir: Optional directory for caching downloaded measurements as Parquet
+        max_workers: Number of concurrent station download threads (default: 8)
         log_file: Optional path for detailed logging
         verbose: Enable console progress logging
     """
@@ -46,6 +170,8 @@ class DWDDataDownloader:
         interpolation_method: str = "linear",
         interpolate_by_default: bool = True,
         interpolation_resolution: float = 30,
+        cache_dir: str | Path | None = None,
+        max_workers: int = 8,
         log_file: str | None = None,
         verbose: bool = True,
     ):
@@ -53,6 +179,8 @@ class DWDDataDownloader:
         self.interpolation_method = interpolation_method
         self.interpolate_by_default = interpolate_by_default
         self.interpolation_resolution = interpolation_resolution
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_workers = max(1, max_workers)
 
         # Configure logging
         self.logger = self._setup_logger(log_file) if verbose or log_file else None
@@ -60,6 +188,14 @@ class DWDDataDownloader:
         # Initialize DWD API settings
         self.settings = Settings(**DWD_SETTINGS)
 
+        # Reusable transformers between geographic and processing coordinates
+        self._to_processing = Transformer.from_crs(
+            CRS_CONFIG["GEOGRAPHIC"], CRS_CONFIG["PROCESSING"], always_xy=True
+        )
+        self._to_geographic = Transformer.from_crs(
+            CRS_CONFIG["PROCESSING"], CRS_CONFIG["GEOGRAPHIC"], always_xy=True
+        )
+
         if self.logger:
             self.logger.info(
                 f"DWD Downloader initialized: buffer={self.buffer_distance}m, "
@@ -97,21 +233,28 @@ class DWDDataDownloader:
             geojson = json.loads(geojson)
         return shape(geojson)
 
-    def _get_bounding_box_from_geometry(
+    def _project_geometry(
         self, geometry: Point | Polygon | MultiPolygon
-    ) -> dict[str, float]:
-        """Extract geographic bounding box coordinates from geometry."""
-        # Ensure geometry is in WGS84 for lat/lon coordinates
+    ) -> Point | Polygon | MultiPolygon:
+        """Transform geometry to the projected processing CRS."""
         if isinstance(geometry, (gpd.GeoDataFrame, gpd.GeoSeries)):
-            geometry = geometry.to_crs(CRS_CONFIG["GEOGRAPHIC"])
+            return geometry.to_crs(CRS_CONFIG["PROCESSING"]).union_all()
+        return shapely.transform(geometry, self._to_processing.transform, interleaved=False)
 
-        bounds = geometry.bounds  # (minx, miny, maxx, maxy)
+    def _get_bounding_box_from_geometry(
+        self, geometry_projected: Point | Polygon | MultiPolygon
+    ) -> dict[str, float]:
+        """Extract geographic bounding box coordinates from a projected geometry."""
+        # Only the bounds are transformed (edges densified), not every vertex
+        min_lon, min_lat, max_lon, max_lat = self._to_geographic.transform_bounds(
+            *geometry_projected.bounds
+        )
 
         return {
-            "min_lat": bounds[1],
-            "max_lat": bounds[3],
-            "min_lon": bounds[0],
-            "max_lon": bounds[2],
+            "min_lat": min_lat,
+            "max_lat": max_lat,
+            "min_lon": min_lon,
+            "max_lon": max_lon,
         }
 
     def _create_interpolation_grid(
@@ -121,30 +264,10 @@ class DWDDataDownloader:
         resolution = resolution or self.interpolation_resolution
 
         # Convert to projected coordinates for metric grid spacing
-        if isinstance(geometry, (gpd.GeoDataFrame, gpd.GeoSeries)):
-            geometry_projected = geometry.to_crs(CRS_CONFIG["PROCESSING"])
-        else:
-            geometry_projected = gpd.GeoSeries([geometry], crs=CRS_CONFIG["GEOGRAPHIC"]).to_crs(
-                CRS_CONFIG["PROCESSING"]
-            )[0]
-
-        # Generate grid coordinates
-        bounds = geometry_projected.bounds
-        x_range = np.arange(bounds[0], bounds[2] + resolution, resolution)
-        y_range = np.arange(bounds[1], bounds[3] + resolution, resolution)
-
-        # Create grid points within geometry bounds
-        grid_points = []
-        for x in x_range:
-            for y in y_range:
-                point = Point(x, y)
-                if geometry_projected.contains(point):
-                    grid_points.append(point)
-
-        # Create GeoDataFrame and transform back to output CRS
-        grid_gdf = gpd.GeoDataFrame(geometry=grid_points, crs=CRS_CONFIG["PROCESSING"]).to_crs(
-            CRS_CONFIG["OUTPUT"]
-        )
+        geometry_projected = self._project_geometry(geometry)
+
+        # Grids are reused across calls for the same area and resolution
+        grid_gdf = _build_interpolation_grid(geometry_projected.wkb, resolution).copy(deep=False)
 
         if self.logger:
             self.logger.info(
@@ -153,10 +276,10 @@ class DWDDataDownloader:
 
         return grid_gdf
 
-    def _interpolate_temperature(
-        self, stations_gdf: gpd.GeoDataFrame, target_gdf: gpd.GeoDataFrame, method: str = None
-    ) -> gpd.GeoDataFrame:
-        """Perform spatial interpolation of temperature from weather stations to grid points."""
+    def _interpolate_at_coordinates(
+        self, stations_gdf: gpd.GeoDataFrame, target_coords: np.ndarray, method: str = None
+    ) -> np.ndarray:
+        """Interpolate station temperatures at (N, 2) coordinates in the processing CRS."""
         method = method or self.interpolation_method
 
         # Use nearest neighbor for sparse station networks
@@ -169,84 +292,125 @@ class DWDDataDownloader:
 
         # Transform to projected coordinates for accurate distance calculations
         stations_projected = stations_gdf.to_crs(CRS_CONFIG["PROCESSING"])
-        target_projected = target_gdf.to_crs(CRS_CONFIG["PROCESSING"])
 
-        # Extract coordinates and temperature values
-        station_coords = np.column_stack(
-            [stations_projected.geometry.x.values, stations_projected.geometry.y.values]
-        )
-        station_temps = stations_projected["ground_temp"].values
-
-        target_coords = np.column_stack(
-            [target_projected.geometry.x.values, target_projected.geometry.y.values]
-        )
-
-        # Perform spatial interpolation
-        interpolated_temps = griddata(
-            station_coords, station_temps, target_coords, method=method, fill_value=np.nan
-        )
+        # Extract coordinates as an (N, 2) block in a single vectorized call
+        station_coords = shapely.get_coordinates(stations_projected.geometry.values)
+        station_temps = stations_projected["ground_temp"].to_numpy(dtype=np.float32)
+
+        # Center coordinates on the stations so float32 keeps millimeter precision
+        origin = station_coords.mean(axis=0)
+        station_coords = (station_coords - origin).astype(np.float32)
+        target_coords = (target_coords - origin).astype(np.float32)
+
+        # Perform spatial interpolation, indexing and triangulating the stations only once
+        station_tree = cKDTree(station_coords)
+        if method == "nearest":
+            interpolated_temps = station_temps[station_tree.query(target_coords)[1]]
+        elif method in ("linear", "cubic"):
+            triangulation = Delaunay(station_coords)
+            if method == "linear":
+                interpolated_temps = _barycentric_interpolate(
+                    target_coords,
+                    triangulation.find_simplex(target_coords),
+                    triangulation.simplices,
+                    triangulation.transform,
+                    station_temps,
+                )
+            else:
+                interpolator = CloughTocher2DInterpolator(triangulation, station_temps)
+                interpolated_temps = interpolator(target_coords)
+        else:
+            raise ValueError(f"Unknown interpolation method: {method}")
 
         # Handle missing values with nearest neighbor fallback
-        if np.any(np.isnan(interpolated_temps)):
+        nan_mask = np.isnan(interpolated_temps)
+        if nan_mask.any():
             if self.logger:
                 self.logger.info("Filling gaps with nearest neighbor interpolation")
-            nan_mask = np.isnan(interpolated_temps)
-            nearest_temps = griddata(
-                station_coords, station_temps, target_coords[nan_mask], method="nearest"
-            )
-            interpolated_temps[nan_mask] = nearest_temps
+            nearest_idx = station_tree.query(target_coords[nan_mask])[1]
+            interpolated_temps[nan_mask] = station_temps[nearest_idx]
+
+        return interpolated_temps.astype(np.float32, copy=False)
 
-        # Create result GeoDataFrame
-        result_gdf = target_gdf.copy()
-        result_gdf["ground_temp"] = interpolated_temps
+    def _interpolate_temperature(
+        self, stations_gdf: gpd.GeoDataFrame, target_gdf: gpd.GeoDataFrame, method: str = None
+    ) -> gpd.GeoDataFrame:
+        """Perform spatial interpolation of temperature from weather stations to grid points."""
+        target_projected = target_gdf.to_crs(CRS_CONFIG["PROCESSING"])
+        target_coords = shapely.get_coordinates(target_projected.geometry.values)
+
+        # Create result GeoDataFrame sharing the target geometry buffers
+        result_gdf = target_gdf.copy(deep=False)
+        result_gdf["ground_temp"] = self._interpolate_at_coordinates(
+            stations_gdf, target_coords, method=method
+        )
 
         if self.logger:
             self.logger.info(f"Temperature interpolation completed for {len(result_gdf)} points")
 
         return result_gdf
 
+    def _interpolate_temperature_raster(
+        self,
+        stations_gdf: gpd.GeoDataFrame,
+        geometry: Point | Polygon | MultiPolygon,
+        resolution: float = None,
+        method: str = None,
+    ) -> tuple[np.ndarray, Affine]:
+        """Interpolate station temperatures onto a north-up raster covering the geometry."""
+        resolution = resolution or self.interpolation_resolution
+
+        # Reuse the cached grid axes and containment mask for this area
+        geometry_projected = self._project_geometry(geometry)
+        x_range, y_range, inside = _build_grid_mask(geometry_projected.wkb, resolution)
+
+        # Flip rows to north-up raster order
+        inside = inside[::-1]
+        xx, yy = np.meshgrid(x_range, y_range[::-1])
+
+        # Evaluate only cells inside the study area and leave the rest as NaN
+        raster = np.full(inside.shape, np.nan, dtype=np.float32)
+        if inside.any():
+            raster[inside] = self._interpolate_at_coordinates(
+                stations_gdf, np.column_stack((xx[inside], yy[inside])), method=method
+            )
+
+        # Grid nodes are cell centers, so the raster origin sits half a cell outside them
+        transform = from_origin(
+            x_range[0] - resolution / 2, y_range[-1] + resolution / 2, resolution, resolution
+        )
+
+        if self.logger:
+            self.logger.info(
+                f"Temperature interpolation completed for {int(inside.sum())} cells "
+                f"on a {raster.shape[0]}x{raster.shape[1]} raster"
+            )
+
+        return raster, transform
+
     def _get_stations_in_area(self, geometry: Point | Polygon | MultiPolygon) -> gpd.GeoDataFrame:
         """Find all weather stations within buffered study area."""
         # Apply spatial buffer in projected coordinates
-        if isinstance(geometry, (gpd.GeoDataFrame, gpd.GeoSeries)):
-            geometry_projected = geometry.to_crs(CRS_CONFIG["PROCESSING"])
-        else:
-            geometry_projected = gpd.GeoSeries([geometry], crs=CRS_CONFIG["GEOGRAPHIC"]).to_crs(
-                CRS_CONFIG["PROCESSING"]
-            )[0]
-
-        buffered_geometry = geometry_projected.buffer(self.buffer_distance)
+        buffered_geometry = self._project_geometry(geometry).buffer(self.buffer_distance)
 
         if self.logger:
             self.logger.info(f"Searching for stations within {self.buffer_distance}m buffer")
 
-        # Convert back to geographic coordinates for API query
-        buffered_geographic = gpd.GeoSeries(
-            [buffered_geometry], crs=CRS_CONFIG["PROCESSING"]
-        ).to_crs(CRS_CONFIG["GEOGRAPHIC"])[0]
-        bbox = self._get_bounding_box_from_geometry(buffered_geographic)
+        # Convert the buffered extent back to geographic coordinates for station filtering
+        bbox = self._get_bounding_box_from_geometry(buffered_geometry)
 
-        # Query DWD API for available stations
-        request = DwdObservationRequest(
-            parameters=DWD_TEMPERATURE_PARAMETERS,
-            start_date="2024-01-01",  # Brief period for station discovery
-            end_date="2024-01-02",
-            settings=self.settings,
-        )
-
-        stations_df = request.all().df
+        # Station metadata is static, so the API request is only issued once per process
+        stations_df = _load_station_metadata(tuple(DWD_TEMPERATURE_PARAMETERS))
 
         if stations_df.is_empty():
             if self.logger:
                 self.logger.warning("No weather stations found in DWD database")
             return gpd.GeoDataFrame()
 
-        # Filter stations within bounding box
+        # Filter stations within bounding box in a single fused range-check pass
         stations_filtered = stations_df.filter(
-            (stations_df["latitude"] >= bbox["min_lat"])
-            & (stations_df["latitude"] <= bbox["max_lat"])
-            & (stations_df["longitude"] >= bbox["min_lon"])
-            & (stations_df["longitude"] <= bbox["max_lon"])
+            pl.col("latitude").is_between(bbox["min_lat"], bbox["max_lat"]),
+            pl.col("longitude").is_between(bbox["min_lon"], bbox["max_lon"]),
         )
 
         if stations_filtered.is_empty():
@@ -254,12 +418,11 @@ class DWDDataDownloader:
                 self.logger.warning("No stations found within specified area")
             return gpd.GeoDataFrame()
 
-        # Convert to GeoDataFrame
+        # Convert only the filtered subset to a GeoDataFrame
+        stations_pdf = stations_filtered.to_pandas()
         stations_gdf = gpd.GeoDataFrame(
-            stations_filtered.to_pandas(),
-            geometry=gpd.points_from_xy(
-                stations_filtered["longitude"], stations_filtered["latitude"]
-            ),
+            stations_pdf,
+            geometry=gpd.points_from_xy(stations_pdf["longitude"], stations_pdf["latitude"]),
             crs=CRS_CONFIG["GEOGRAPHIC"],
         )
 
@@ -268,9 +431,37 @@ class DWDDataDownloader:
 
         return stations_gdf
 
+    def _get_measurement_cache_path(
+        self, station_ids: list, start_date: datetime, end_date: datetime
+    ) -> Path | None:
+        """Build a content-addressed cache path for a measurement request."""
+        if self.cache_dir is None:
+            return None
+
+        request_key = (
+            sorted(str(station_id) for station_id in station_ids),
+            start_date.isoformat(),
+            end_date.isoformat(),
+            DWD_TEMPERATURE_PARAMETERS,
+        )
+        digest = hashlib.blake2b(repr(request_key).encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.parquet"
+
+    def _fetch_station_measurements(
+        self, station_ids: list, start_date: datetime, end_date: datetime
+    ) -> pl.DataFrame:
+        """Download temperature measurements for a group of stations from the DWD API."""
+        request = DwdObservationRequest(
+            parameters=DWD_TEMPERATURE_PARAMETERS,
+            start_date=start_date,
+            end_date=end_date,
+            settings=self.settings,
+        )
+        return request.filter_by_station_id(station_ids).values.all().df
+
     def _get_temperature_data_for_period(
         self, station_ids: list, start_date: datetime, end_date: datetime
-    ) -> pd.DataFrame:
+    ) -> pl.DataFrame:
         """Download temperature measurements for specified stations and time period."""
         if self.logger:
             self.logger.info(
@@ -278,46 +469,87 @@ class DWDDataDownloader:
                 f"from {start_date.date()} to {end_date.date()}"
             )
 
-        # Create DWD API request
-        request = DwdObservationRequest(
-            parameters=DWD_TEMPERATURE_PARAMETERS,
-            start_date=start_date,
-            end_date=end_date,
-            settings=self.settings,
-        )
+        cache_path = self._get_measurement_cache_path(station_ids, start_date, end_date)
 
-        # Retrieve temperature data
-        temp_data = request.filter_by_station_id(station_ids).values.all().df
+        if cache_path is not None and cache_path.exists():
+            if self.logger:
+                self.logger.info(f"Loading cached temperature data from {cache_path}")
+            temp_data = pl.read_parquet(cache_path)
+        else:
+            # Station files are independent downloads, so fetch groups of stations concurrently
+            chunk_size = max(1, math.ceil(len(station_ids) / self.max_workers))
+            station_chunks = [
+                station_ids[i : i + chunk_size] for i in range(0, len(station_ids), chunk_size)
+            ]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._fetch_station_measurements, chunk, start_date, end_date)
+                    for chunk in station_chunks
+                ]
+                frames = [future.result() for future in futures]
+
+            frames = [frame for frame in frames if not frame.is_empty()]
+            temp_data = pl.concat(frames, how="vertical_relaxed") if frames else pl.DataFrame()
+
+            # Only completed periods are cached, ongoing ones still receive new measurements;
+            # "now" follows end_date's timezone so aware and naive dates both compare
+            period_completed = end_date < datetime.now(end_date.tzinfo)
+            if cache_path is not None and not temp_data.is_empty() and period_completed:
+                self._write_measurement_cache(cache_path, temp_data)
 
         if temp_data.is_empty():
             if self.logger:
                 self.logger.warning("No temperature measurements available for specified period")
-            return pd.DataFrame()
-
-        temp_df = temp_data.to_pandas()
+            return temp_data
 
         if self.logger:
-            self.logger.info(f"Downloaded {len(temp_df)} temperature measurements")
-
-        return temp_df
+            self.logger.info(f"Downloaded {temp_data.height} temperature measurements")
+
+        return temp_data
+
+    def _write_measurement_cache(self, cache_path: Path, temp_data: pl.DataFrame) -> None:
+        """Atomically store measurements as Parquet; failures only cost the cache."""
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temporary file per writer, since concurrent area downloads may
+            # cache the same stations and period at the same time
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = Path(f.name)
+                temp_data.write_parquet(f, compression="zstd")
+            tmp_path.replace(cache_path)
+        except Exception as e:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            if self.logger:
+                self.logger.warning(f"Could not cache temperature data at {cache_path}: {e}")
 
     def _calculate_station_averages(
-        self, stations_gdf: gpd.GeoDataFrame, temp_data: pd.DataFrame
+        self, stations_gdf: gpd.GeoDataFrame, temp_data: pl.DataFrame
     ) -> gpd.GeoDataFrame:
         """Compute average temperature statistics for each weather station."""
         if self.logger:
             self.logger.info("Computing station temperature averages")
 
-        if temp_data.empty:
+        if temp_data.is_empty():
             return gpd.GeoDataFrame()
 
-        # Calculate temperature statistics per station
-        station_stats = temp_data.groupby("station_id").agg({"value": ["mean", "std", "count"]})
-        station_stats.columns = ["ground_temp", "temp_std", "measurement_count"]
-        station_stats = station_stats.reset_index()
+        # Calculate temperature statistics per station (NaN treated as missing like pandas)
+        value = pl.col("value").fill_nan(None)
+        station_stats = temp_data.group_by("station_id").agg(
+            value.mean().alias("ground_temp"),
+            value.std().alias("temp_std"),
+            value.count().alias("measurement_count"),
+        )
 
-        # Merge with station metadata
-        stations_with_temp = stations_gdf.merge(station_stats, on="station_id", how="inner")
+        # Join with station metadata on the station_id index
+        stations_with_temp = (
+            stations_gdf.set_index("station_id")
+            .join(station_stats.to_pandas().set_index("station_id"), how="inner")
+            .reset_index()
+        )
 
         # Add measurement period information
         stations_with_temp["period_start"] = temp_data["date"].min()
@@ -335,7 +567,12 @@ class DWDDataDownloader:
         end_date: datetime,
         interpolate: bool | None = None,
         resolution: float = None,
-    ) -> gpd.GeoDataFrame | tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
+        as_raster: bool = False,
+    ) -> (
+        gpd.GeoDataFrame
+        | tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]
+        | tuple[gpd.GeoDataFrame, tuple[np.ndarray, Affine]]
+    ):
         """
         Download weather data for specified area and time period.
 
@@ -349,10 +586,14 @@ class DWDDataDownloader:
             end_date: End of measurement period
             interpolate: Enable spatial interpolation (default from settings)
             resolution: Grid resolution for interpolation in meters
+            as_raster: Return the interpolated grid as a 2D array instead of points
 
         Returns:
             If interpolate=False: GeoDataFrame with station data
             If interpolate=True: Tuple of (station_data, interpolated_grid)
+            If interpolate=True and as_raster=True: Tuple of
+                (station_data, (temperature_array, transform)) with a north-up float32
+                array (NaN outside the area) and its affine transform in the processing CRS
 
         Raises:
             ValueError: If no weather stations or data available for the area/period
@@ -384,7 +625,7 @@ class DWDDataDownloader:
             start_date=start_date,
             end_date=end_date,
         )
-        if temp_data.empty:
+        if temp_data.is_empty():
             raise ValueError("No temperature data available for specified period")
 
         # Calculate station averages
@@ -400,6 +641,20 @@ class DWDDataDownloader:
             if self.logger:
                 self.logger.info("Generating interpolated temperature grid")
 
+            # Interpolate directly onto a raster when array output is requested
+            if as_raster:
+                raster, transform = self._interpolate_temperature_raster(
+                    stations_with_temp, geometry, resolution, method=self.interpolation_method
+                )
+                if np.isnan(raster).all():
+                    if self.logger:
+                        self.logger.warning(
+                            "Unable to create interpolation grid, returning station data only"
+                        )
+                    return stations_with_temp
+
+                return stations_with_temp, (raster, transform)
+
             # Create interpolation grid
             grid_gdf = self._create_interpolation_grid(geometry, resolution)
             if grid_gdf.empty:
@@ -425,6 +680,62 @@ class DWDDataDownloader:
         else:
             return stations_with_temp
 
+    def download_for_areas(
+        self,
+        area_requests: list[
+            tuple[
+                Point | Polygon | MultiPolygon | str | dict[str, Any] | gpd.GeoDataFrame,
+                datetime,
+                datetime,
+            ]
+        ],
+        interpolate: bool | None = None,
+        resolution: float = None,
+        as_raster: bool = False,
+        max_workers: int | None = None,
+    ) -> list[
+        gpd.GeoDataFrame
+        | tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]
+        | tuple[gpd.GeoDataFrame, tuple[np.ndarray, Affine]]
+    ]:
+        """
+        Download weather data for several areas and/or periods in parallel.
+
+        Each request is processed by download_for_area on a thread pool. Station
+        downloads overlap on network I/O, and the interpolation kernels release the
+        GIL, so grid evaluation for different requests also runs concurrently.
+
+        Args:
+            area_requests: Sequence of (geometry, start_date, end_date) tuples
+            interpolate: Enable spatial interpolation (default from settings)
+            resolution: Grid resolution for interpolation in meters
+            as_raster: Return interpolated grids as 2D arrays instead of points
+            max_workers: Number of requests processed in parallel (default from settings)
+
+        Returns:
+            Results of download_for_area in the same order as area_requests
+
+        Raises:
+            ValueError: If no weather stations or data available for any area/period
+        """
+        if self.logger:
+            self.logger.info(f"Processing {len(area_requests)} weather data requests in parallel")
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.download_for_area,
+                    geometry,
+                    start_date,
+                    end_date,
+                    interpolate=interpolate,
+                    resolution=resolution,
+                    as_raster=as_raster,
+                )
+                for geometry, start_date, end_date in area_requests
+            ]
+            return [future.result() for future in futures]
+
 
 if __name__ == "__main__":
     import shapely.geometry
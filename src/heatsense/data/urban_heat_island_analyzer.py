@@ -7,31 +7,272 @@ identify thermal hotspots, analyze spatial patterns, and generate mitigation
 recommendations for urban planning applications.
 """
 
+import functools
+import itertools
 import logging
-import warnings
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 from pathlib import Path
 
 import ee
-import esda
 import geopandas as gpd
 import libpysal.weights
 import numpy as np
 import pandas as pd
-from scipy.stats import pearsonr
-from shapely.geometry import box
+import shapely
+from numba import njit, prange
+from pyproj import Geod
+from rasterio.features import rasterize
+from rasterio.transform import from_origin
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.special import ndtr, stdtr
 
 from heatsense.config.settings import (
     CRS_CONFIG,
     UHI_EARTH_ENGINE_PROJECT,
+    UHI_EARTH_ENGINE_URL,
     UHI_LOG_LEVEL,
 )
 from heatsense.utils.data_processor import (
-    UHI_CATEGORY_DESCRIPTIONS,
+    UHI_CATEGORY_DESCRIPTIONS_DE,
     process_corine_for_uhi,
     standardize_weather_data,
 )
 
+# Land use categories whose temperature correlation drives desealing or cooling advice
+_WARMING_LANDUSES = frozenset({"dense_urban", "transport", "industrial"})
+_COOLING_LANDUSE_NAMES = {
+    "forest": "Wald und natürlicher Vegetation",
+    "water": "Gewässern",
+    "urban_green": "städtischem Grün",
+}
+
+# Strategy templates for the dominant land use types in hotspot areas
+_LANDUSE_STRATEGIES = {
+    "dense_urban": {
+        "strategy": "Urbane Verdichtung kühlen",
+        "description": "Dicht bebaute Bereiche: Dach- und Fassadenbegrünung, kühle Materialien und vertikale Gärten.",
+        "priority": "critical",
+    },
+    "residential": {
+        "strategy": "Wohnquartiere optimieren",
+        "description": "Wohnbereiche: Straßenbäume, private Gartenbegrünung, Hofentsiegelung und Wasserspiele.",
+        "priority": "high",
+    },
+    "industrial": {
+        "strategy": "Gewerbeflächen optimieren",
+        "description": "Industriegebiete: Extensive Dachbegrünung, Parkplatzentsiegelung und Verschattungsanlagen.",
+        "priority": "high",
+    },
+    "transport": {
+        "strategy": "Verkehrsflächen kühlen",
+        "description": "Verkehrsbereiche: Straßenbegleitgrün, helle Fahrbahnbeläge und Baumalleen.",
+        "priority": "medium",
+    },
+    "urban_green": {
+        "strategy": "Grünflächen stärken",
+        "description": "Grünbereiche: Verstärkte Bewässerung, schattenspendende Bäume und Wasserflächen.",
+        "priority": "low",
+    },
+}
+
+
+@njit(cache=True, fastmath=True)
+def _pearson_r(x: np.ndarray, y: np.ndarray) -> float:
+    """Compute the Pearson correlation coefficient in a single pass over both arrays."""
+    n = x.shape[0]
+
+    # Shift by the first sample so the sums of squares do not lose precision
+    x0 = x[0]
+    y0 = y[0]
+    sum_x = sum_y = sum_xx = sum_yy = sum_xy = 0.0
+    for i in range(n):
+        a = x[i] - x0
+        b = y[i] - y0
+        sum_x += a
+        sum_y += b
+        sum_xx += a * a
+        sum_yy += b * b
+        sum_xy += a * b
+
+    covariance = sum_xy - sum_x * sum_y / n
+    variance_x = sum_xx - sum_x * sum_x / n
+    variance_y = sum_yy - sum_y * sum_y / n
+    r = covariance / np.sqrt(variance_x * variance_y)
+    return max(-1.0, min(1.0, r))
+
+
+def _pearson_correlation(x, y) -> tuple[float, float]:
+    """Return the Pearson coefficient and its two-sided p-value from the t statistic."""
+    n = len(x)
+    r = _pearson_r(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+
+    if n < 3:
+        return r, 1.0
+    if abs(r) >= 1.0:
+        return r, 0.0
+
+    t_stat = r * np.sqrt((n - 2) / (1.0 - r * r))
+    return r, float(2.0 * stdtr(n - 2, -abs(t_stat)))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_analysis_grid(
+    boundary_wkbs: tuple[bytes, ...], boundary_crs: str, cell_size: float
+) -> gpd.GeoDataFrame:
+    """Generate grid cells intersecting a boundary, memoized by WKB, CRS and cell size."""
+    # Reproject to a projected CRS
+    boundary = gpd.GeoSeries.from_wkb(list(boundary_wkbs), crs=boundary_crs).to_crs(
+        CRS_CONFIG["WEB_MERCATOR"]
+    )
+
+    minx, miny, maxx, maxy = boundary.total_bounds
+    x_coords = np.arange(minx, maxx, cell_size)
+    y_coords = np.arange(miny, maxy, cell_size)
+
+    # Rasterize the area and its outline once onto the cell layout
+    boundary_geom = boundary.iloc[0]
+    grid_shape = (len(y_coords), len(x_coords))
+    transform = from_origin(minx, miny + len(y_coords) * cell_size, cell_size, cell_size)
+    burn_options = {
+        "out_shape": grid_shape,
+        "transform": transform,
+        "all_touched": True,
+        "dtype": np.uint8,
+    }
+
+    # Flip rows south to north and transpose so both masks index as [column, row]
+    touched = rasterize([(boundary_geom, 1)], **burn_options)[::-1].T.astype(bool)
+    on_edge = rasterize([(boundary_geom.boundary, 1)], **burn_options)[::-1].T.astype(bool)
+
+    # Build only the touched cells, ordered column by column
+    col_idx, row_idx = np.nonzero(touched)
+    xx, yy = x_coords[col_idx], y_coords[row_idx]
+    cells = shapely.box(xx, yy, xx + cell_size, yy + cell_size)
+
+    # Cells away from the outline lie inside; only edge cells need an exact intersects test
+    needs_check = on_edge[col_idx, row_idx]
+    keep = ~needs_check
+    shapely.prepare(boundary_geom)
+    keep[needs_check] = shapely.intersects(boundary_geom, cells[needs_check])
+    cells = cells[keep]
+
+    grid = gpd.GeoDataFrame(geometry=cells, crs=boundary.crs)
+    return grid.to_crs(CRS_CONFIG["OUTPUT"])
+
+
+def _queen_weights(geometries: gpd.GeoSeries) -> libpysal.weights.W:
+    """Build Queen contiguity weights from shared polygon vertices in vectorized form."""
+    # Vertices of all polygons, tagged with the position of the polygon they belong to
+    coords, owner = shapely.get_coordinates(geometries.values, return_index=True)
+
+    # Number identical vertices and record which polygons touch each of them
+    _, vertex_id = np.unique(coords, axis=0, return_inverse=True)
+    vertex_id = vertex_id.ravel()
+    incidence = csr_matrix(
+        (np.ones(len(owner), dtype=np.int32), (owner, vertex_id)),
+        shape=(len(geometries), int(vertex_id.max()) + 1 if len(vertex_id) else 0),
+    )
+
+    # Polygons sharing at least one vertex are Queen neighbours (excluding themselves)
+    adjacency = (incidence @ incidence.T).tocsr()
+    adjacency.setdiag(0)
+    adjacency.eliminate_zeros()
+    adjacency.data = np.ones_like(adjacency.data, dtype=np.float64)
+    adjacency.sort_indices()
+
+    return libpysal.weights.WSP(adjacency, id_order=list(geometries.index)).to_W(
+        silence_warnings=True
+    )
+
+
+@njit(parallel=True, nogil=True, cache=True, fastmath=True)
+def _local_moran_permutations(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    z: np.ndarray,
+    n_perm: int,
+    seed: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute local Moran's I and its conditional-permutation z-scores on a CSR matrix."""
+    n = z.shape[0]
+    scale = (n - 1) / np.dot(z, z)
+    local_i = np.zeros(n)
+    z_sim = np.zeros(n)
+
+    for i in prange(n):
+        start = indptr[i]
+        k = indptr[i + 1] - start
+        if k == 0:
+            continue
+
+        lag = 0.0
+        for p in range(start, start + k):
+            lag += data[p] * z[indices[p]]
+        local_i[i] = scale * z[i] * lag
+
+        # Per-cell xorshift stream so results do not depend on thread scheduling
+        state = np.uint64(seed) ^ (np.uint64(i + 1) * np.uint64(0x9E3779B97F4A7C15))
+        drawn = np.empty(k, dtype=np.int64)
+        total = 0.0
+        total_sq = 0.0
+        for _ in range(n_perm):
+            # Draw k distinct non-focal cells to stand in for the neighbours
+            lag_sim = 0.0
+            for m in range(k):
+                while True:
+                    state ^= state << np.uint64(13)
+                    state ^= state >> np.uint64(7)
+                    state ^= state << np.uint64(17)
+                    j = np.int64(state % np.uint64(n - 1))
+                    if j >= i:
+                        j += 1
+                    unique = True
+                    for q in range(m):
+                        if drawn[q] == j:
+                            unique = False
+                            break
+                    if unique:
+                        break
+                drawn[m] = j
+                lag_sim += data[start + m] * z[j]
+            simulated = scale * z[i] * lag_sim
+            total += simulated
+            total_sq += simulated * simulated
+
+        mean = total / n_perm
+        variance = total_sq / n_perm - mean * mean
+        if variance > 0.0:
+            z_sim[i] = (local_i[i] - mean) / np.sqrt(variance)
+
+    return local_i, z_sim
+
+
+def _local_moran_conditional(weights: csr_matrix, z: np.ndarray) -> np.ndarray:
+    """Compute local Moran's I z-scores from the exact conditional-randomization moments."""
+    n_others = z.shape[0] - 1
+    lag = weights @ z
+    row_sums = np.asarray(weights.sum(axis=1)).ravel()
+    row_sq_sums = np.asarray(weights.multiply(weights).sum(axis=1)).ravel()
+
+    # With z_i held fixed, the neighbours are drawn without replacement from the other
+    # n - 1 values, whose mean and variance follow from the centred sums
+    others_mean = -z / n_others
+    others_var = (np.dot(z, z) - z * z) / n_others - others_mean * others_mean
+    lag_var = others_var * (n_others * row_sq_sums - row_sums * row_sums) / (n_others - 1)
+
+    z_scores = np.zeros_like(z)
+    valid = lag_var > 0
+    z_scores[valid] = (
+        np.sign(z[valid])
+        * (lag[valid] - row_sums[valid] * others_mean[valid])
+        / np.sqrt(lag_var[valid])
+    )
+    return z_scores
+
 
 class UrbanHeatIslandAnalyzer:
     """
@@ -54,6 +295,9 @@ class UrbanHeatIslandAnalyzer:
         hotspot_threshold: Temperature percentile for hotspot detection (0-1, default: 0.9)
         min_cluster_size: Minimum cells for valid hotspot clusters (default: 5)
         use_grouped_categories: Enable simplified land use categories (default: True)
+        max_workers: Concurrent Earth Engine requests for temperature extraction (default: 8)
+        hotspot_permutations: Random permutations for local Moran's I significance; 0 uses
+            the exact conditional moments instead (default: 0)
         log_file: Optional path for detailed logging output
         logger: Optional custom logger instance
     """
@@ -65,6 +309,8 @@ class UrbanHeatIslandAnalyzer:
         hotspot_threshold: float = 0.9,
         min_cluster_size: int = 5,
         use_grouped_categories: bool = True,
+        max_workers: int = 8,
+        hotspot_permutations: int = 0,
         log_file: Path | None = None,
         logger: logging.Logger | None = None,
     ):
@@ -73,7 +319,10 @@ class UrbanHeatIslandAnalyzer:
         self.hotspot_threshold = hotspot_threshold
         self.min_cluster_size = min_cluster_size
         self.use_grouped_categories = use_grouped_categories
+        self.max_workers = max(1, max_workers)
+        self.hotspot_permutations = max(0, hotspot_permutations)
         self.initialized = False
+        self._weights_cache: dict[tuple, libpysal.weights.W] = {}
         self.logger = logger or self._setup_logger(log_file)
         self.logger.info("UHI Analyzer initialized with custom configuration")
 
@@ -129,7 +378,8 @@ class UrbanHeatIslandAnalyzer:
 
             # Use provided project or default from configuration
             project_id = project or UHI_EARTH_ENGINE_PROJECT
-            ee.Initialize(project=project_id)
+            # The high-volume endpoint serves the concurrent pixel requests of the extraction
+            ee.Initialize(project=project_id, url=UHI_EARTH_ENGINE_URL)
             self.initialized = True
             self.logger.info(
                 f"Google Earth Engine successfully initialized with project: {project_id}"
@@ -248,8 +498,9 @@ class UrbanHeatIslandAnalyzer:
             hot_spots = results.get("hot_spots", gpd.GeoDataFrame())
 
             if not temp_stats.empty and "temperature" in temp_stats.columns:
-                valid_temps = temp_stats["temperature"].dropna()
-                if len(valid_temps) > 0:
+                temperatures = temp_stats["temperature"].to_numpy(dtype=np.float64)
+                valid_temps = temperatures[~np.isnan(temperatures)]
+                if valid_temps.size:
                     self.logger.info(
                         f"Temperature analysis: {len(temp_stats)} grid cells processed"
                     )
@@ -261,8 +512,9 @@ class UrbanHeatIslandAnalyzer:
             if not hot_spots.empty:
                 self.logger.info(f"Heat hotspots identified: {len(hot_spots)} clusters")
                 if "temperature" in hot_spots.columns:
-                    hotspot_temps = hot_spots["temperature"].dropna()
-                    if len(hotspot_temps) > 0:
+                    hotspot_temps = hot_spots["temperature"].to_numpy(dtype=np.float64)
+                    hotspot_temps = hotspot_temps[~np.isnan(hotspot_temps)]
+                    if hotspot_temps.size:
                         self.logger.info(
                             f"Hotspot temperature range: {hotspot_temps.min():.1f}°C to {hotspot_temps.max():.1f}°C"
                         )
@@ -275,7 +527,7 @@ class UrbanHeatIslandAnalyzer:
         try:
             if isinstance(data, str):
                 self.logger.info(f"Loading {data_type} from file: {data}")
-                gdf = gpd.read_file(data)
+                gdf = gpd.read_file(data, engine="pyogrio", use_arrow=True)
             else:
                 self.logger.info(f"Using provided {data_type} GeoDataFrame")
                 gdf = data.copy()
@@ -330,29 +582,24 @@ class UrbanHeatIslandAnalyzer:
         """Calculate detailed temperature statistics."""
         self.logger.info("Calculating temperature statistics from satellite data")
 
-        # Convert Landsat 8 ST_B10 to Celsius
+        # Convert Landsat 8 ST_B10 to Celsius, keeping the native 30m projection of the scenes
         temp_image = (
-            collection.mean().select("ST_B10").multiply(0.00341802).add(149.0).subtract(273.15)
+            collection.mean()
+            .setDefaultProjection(collection.first().projection())
+            .select("ST_B10")
+            .multiply(0.00341802)
+            .add(149.0 - 273.15)  # Scale offset and Kelvin conversion in one per-pixel step
         )
 
-        # Calculate various statistics
-        temp_image.reduceRegion(
-            reducer=ee.Reducer.percentile([10, 25, 50, 75, 90])
-            .combine(ee.Reducer.mean(), None, True)
-            .combine(ee.Reducer.stdDev(), None, True),
-            geometry=ee.Geometry.Rectangle(boundary.geometry.iloc[0].bounds),
-            scale=30,  # Analysis scale in meters
-            maxPixels=1e9,  # Maximum pixels for Earth Engine operations
-        ).getInfo()
-
         # Create spatial grid for detailed analysis
         self.logger.info("Creating analysis grid for spatial analysis")
         grid = self._create_analysis_grid(boundary)
         grid["temperature"] = self._extract_temperatures(temp_image, grid)
 
         # Log temperature statistics for the grid
-        valid_temps = grid["temperature"][~pd.isna(grid["temperature"])]
-        if len(valid_temps) > 0:
+        temperatures = grid["temperature"].to_numpy(dtype=np.float64)
+        valid_temps = temperatures[~np.isnan(temperatures)]
+        if valid_temps.size:
             self.logger.info(
                 f"Grid temperature statistics: Mean={valid_temps.mean():.1f}°C, "
                 f"Min={valid_temps.min():.1f}°C, Max={valid_temps.max():.1f}°C"
@@ -370,23 +617,11 @@ class UrbanHeatIslandAnalyzer:
         if cell_size is None:
             cell_size = self.grid_cell_size
 
-        # Reproject to a projected CRS
-        boundary = boundary.to_crs(CRS_CONFIG["WEB_MERCATOR"])
-
-        minx, miny, maxx, maxy = boundary.total_bounds
-        x_coords = np.arange(minx, maxx, cell_size)
-        y_coords = np.arange(miny, maxy, cell_size)
-
-        cells = []
-        for x in x_coords:
-            for y in y_coords:
-                cell_geom = box(x, y, x + cell_size, y + cell_size)
-                # Only include cells that intersect with the boundary
-                if boundary.geometry.iloc[0].intersects(cell_geom):
-                    cells.append(cell_geom)
-
-        grid = gpd.GeoDataFrame(geometry=cells, crs=boundary.crs)
-        grid = grid.to_crs(CRS_CONFIG["OUTPUT"])
+        # Grids are reused across analyses of the same boundary and cell size; the same
+        # arguments identify the grid for the hotspot spatial weights cache
+        grid_key = (tuple(boundary.geometry.to_wkb()), boundary.crs.to_wkt(), cell_size)
+        grid = _build_analysis_grid(*grid_key).copy(deep=False)
+        grid.attrs["analysis_grid_key"] = grid_key
 
         self.logger.info(f"Created analysis grid with {len(grid)} cells ({cell_size}m resolution)")
         return grid
@@ -396,84 +631,85 @@ class UrbanHeatIslandAnalyzer:
         self.logger.info("Extracting temperature values for grid cells using Earth Engine")
 
         try:
-            # For large grids, process in smaller batches to avoid timeout
-            batch_size = 5000  # Process in batches of 5000 cells
-            temperatures = []
-
-            total_batches = (len(grid) + batch_size - 1) // batch_size
-            self.logger.info(f"Processing {len(grid)} grid cells in {total_batches} batches")
-
-            for i in range(0, len(grid), batch_size):
-                batch_end = min(i + batch_size, len(grid))
-                batch_grid = grid.iloc[i:batch_end]
-
-                self.logger.info(
-                    f"Processing batch {i // batch_size + 1}/{total_batches} ({len(batch_grid)} cells)"
-                )
-
-                # Convert batch grid cells to Earth Engine FeatureCollection
-                features = []
-                for idx, row in batch_grid.iterrows():
-                    # Convert geometry to Earth Engine geometry
-                    geom = ee.Geometry(row.geometry.__geo_interface__)
-                    feature = ee.Feature(geom, {"grid_id": int(idx)})
-                    features.append(feature)
-
-                batch_fc = ee.FeatureCollection(features)
-
-                # Extract temperature values using reduceRegions (without maxPixels parameter)
-                temp_values = temp_image.reduceRegions(
-                    collection=batch_fc, reducer=ee.Reducer.mean(), scale=30
-                )
-
-                # Get the results and convert to numpy array
-                try:
-                    temp_info = temp_values.getInfo()
-
-                    # Debug: Check what we're getting back
-                    if i == 0:  # Only log for first batch
-                        self.logger.info(
-                            f"Sample feature properties: {temp_info['features'][0]['properties'] if temp_info['features'] else 'No features'}"
-                        )
-
-                    # Create a mapping from grid_id to temperature for this batch
-                    temp_dict = {}
-                    for feature in temp_info["features"]:
-                        grid_id = feature["properties"]["grid_id"]
-                        properties = feature["properties"]
-
-                        # Try different possible temperature property names
-                        temp_value = None
-                        for temp_key in ["ST_B10", "mean", "ST_B10", "temperature"]:
-                            if temp_key in properties and properties[temp_key] is not None:
-                                temp_value = properties[temp_key]
-                                break
-
-                        if temp_value is not None:
-                            # Temperature is already in Celsius from the temp_image calculation
-                            temp_dict[grid_id] = temp_value
-                        else:
-                            temp_dict[grid_id] = np.nan
-
-                    # Add temperatures for this batch in the correct order
-                    batch_temperatures = [temp_dict.get(idx, np.nan) for idx in batch_grid.index]
-                    temperatures.extend(batch_temperatures)
+            # Recover the regular grid layout from the cell bounds in the grid CRS
+            cell_bounds = shapely.bounds(grid.to_crs(CRS_CONFIG["WEB_MERCATOR"]).geometry.values)
+            cell_size = float(cell_bounds[0, 2] - cell_bounds[0, 0])
+            origin_x = float(cell_bounds[:, 0].min())
+            origin_y = float(cell_bounds[:, 3].max())
+            cols = np.rint((cell_bounds[:, 0] - origin_x) / cell_size).astype(np.int64)
+            rows = np.rint((origin_y - cell_bounds[:, 3]) / cell_size).astype(np.int64)
+            n_cols = int(cols.max()) + 1
+            n_rows = int(rows.max()) + 1
+
+            # Average 30m pixels into grid cells server-side instead of uploading cell geometries
+            nodata = -9999.0
+            pixels_per_side = int(np.ceil(cell_size / 30)) + 1
+            cell_image = (
+                temp_image.rename("temperature")
+                .reduceResolution(reducer=ee.Reducer.mean(), maxPixels=pixels_per_side**2)
+                .unmask(nodata)
+                .toFloat()
+            )
 
-                except Exception as e:
-                    self.logger.warning(f"Error processing batch {i // batch_size + 1}: {str(e)}")
-                    # Fill with NaN for this batch
-                    temperatures.extend([np.nan] * len(batch_grid))
+            # Fetch the cell raster in row strips to stay below the request size limit
+            rows_per_strip = max(1, 500_000 // n_cols)
+            strip_starts = range(0, n_rows, rows_per_strip)
+            self.logger.info(
+                f"Processing {len(grid)} grid cells as a {n_rows}x{n_cols} raster "
+                f"in {len(strip_starts)} requests"
+            )
 
-            temperatures_array = np.array(temperatures)
-            valid_count = np.sum(~np.isnan(temperatures_array))
+            def fetch_strip(row_start: int) -> tuple[np.ndarray, np.ndarray]:
+                """Download one row strip and return the cells it covers with their values."""
+                row_stop = min(row_start + rows_per_strip, n_rows)
+                in_strip = np.flatnonzero((rows >= row_start) & (rows < row_stop))
+                pixels = ee.data.computePixels(
+                    {
+                        "expression": cell_image,
+                        "fileFormat": "NUMPY_NDARRAY",
+                        "grid": {
+                            "dimensions": {"width": n_cols, "height": row_stop - row_start},
+                            "affineTransform": {
+                                "scaleX": cell_size,
+                                "shearX": 0,
+                                "translateX": origin_x,
+                                "shearY": 0,
+                                "scaleY": -cell_size,
+                                "translateY": origin_y - row_start * cell_size,
+                            },
+                            "crsCode": CRS_CONFIG["WEB_MERCATOR"],
+                        },
+                    }
+                )["temperature"]
+                return in_strip, pixels[rows[in_strip] - row_start, cols[in_strip]]
+
+            # Strips are independent read-only requests, so they are issued concurrently
+            # Grid temperatures need ~0.01°C precision, so float32 halves memory without loss
+            temperatures_array = np.full(len(grid), np.nan, dtype=np.float32)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(fetch_strip, row_start): row_start // rows_per_strip + 1
+                    for row_start in strip_starts
+                }
+                for future in as_completed(futures):
+                    try:
+                        in_strip, values = future.result()
+                        # Temperature is already in Celsius from the temp_image calculation
+                        temperatures_array[in_strip] = values
+                    except Exception as e:
+                        self.logger.warning(f"Error processing strip {futures[future]}: {str(e)}")
+                        # Cells of this strip keep their NaN values
+
+            temperatures_array[temperatures_array == nodata] = np.nan
+            valid_temps = temperatures_array[~np.isnan(temperatures_array)]
+            valid_count = valid_temps.size
 
             self.logger.info(f"Successfully processed {len(grid)} grid cells")
             self.logger.info(
                 f"Valid temperature values: {valid_count} ({valid_count / len(grid) * 100:.1f}%)"
             )
 
-            if valid_count > 0:
-                valid_temps = temperatures_array[~np.isnan(temperatures_array)]
+            if valid_count:
                 self.logger.info(
                     f"Temperature range: {valid_temps.min():.1f}°C to {valid_temps.max():.1f}°C"
                 )
@@ -484,7 +720,7 @@ class UrbanHeatIslandAnalyzer:
         except Exception as e:
             self.logger.error(f"Error extracting temperatures: {str(e)}")
             self.logger.warning("Falling back to NaN values for all grid cells")
-            return np.full(len(grid), np.nan)
+            return np.full(len(grid), np.nan, dtype=np.float32)
 
     def _analyze_landuse_correlation(
         self,
@@ -509,24 +745,46 @@ class UrbanHeatIslandAnalyzer:
             self.logger.info(f"Reprojected land use data to {temp_data.crs}")
 
         # Process land use data with German UHI categories
-        landuse_processed = process_corine_for_uhi(landuse, logger=self.logger)
-        analysis_column = "landuse_type"
+        landuse_processed = process_corine_for_uhi(
+            landuse, logger_instance=self.logger, language="de"
+        )
+        analysis_column = "landuse_category"
 
         # Build German category descriptions
         category_descriptions = {}
         for category in landuse_processed[analysis_column].unique():
-            if category in UHI_CATEGORY_DESCRIPTIONS:
-                category_descriptions[category] = UHI_CATEGORY_DESCRIPTIONS[category]
+            if category in UHI_CATEGORY_DESCRIPTIONS_DE:
+                category_descriptions[category] = UHI_CATEGORY_DESCRIPTIONS_DE[category]
             else:
                 category_descriptions[category] = f"Unbekannte Kategorie: {category}"
 
         # Spatial join between temperature grid and land use
         try:
-            joined = gpd.sjoin(temp_data, landuse_processed, how="left")
+            tree = shapely.STRtree(landuse_processed.geometry.values)
+            grid_idx, landuse_idx = tree.query(temp_data.geometry.values, predicate="intersects")
+
+            # Keep grid cells without any intersecting land use, as in a left join
+            unmatched = np.setdiff1d(np.arange(len(temp_data)), grid_idx)
+            grid_idx = np.concatenate([grid_idx, unmatched])
+            landuse_idx = np.concatenate([landuse_idx, np.full(len(unmatched), -1)])
+            order = np.lexsort((landuse_idx, grid_idx))
+            grid_idx, landuse_idx = grid_idx[order], landuse_idx[order]
+
+            # Attach land use attributes by position; unmatched cells get missing values
+            landuse_attributes = (
+                landuse_processed.drop(columns=landuse_processed.geometry.name)
+                .reset_index(drop=True)
+                .reindex(landuse_idx)
+                .rename(columns=lambda col: f"{col}_right" if col in temp_data.columns else col)
+            )
+            joined = temp_data.iloc[grid_idx].assign(
+                **{col: landuse_attributes[col].array for col in landuse_attributes.columns}
+            )
             self.logger.info(f"Spatial join completed: {len(joined)} records")
 
             # Debug: Log unique landuse types found after join
             unique_landuse = joined[analysis_column].value_counts()
+            unique_landuse = unique_landuse[unique_landuse > 0]
             self.logger.info(f"Unique landuse types after join: {dict(unique_landuse)}")
 
         except Exception as e:
@@ -534,14 +792,23 @@ class UrbanHeatIslandAnalyzer:
             return {"statistics": {}, "correlations": {}}
 
         # Fill missing values in the analysis column
-        joined[analysis_column] = joined[analysis_column].fillna("unknown")
-        joined["impervious_area"] = joined["impervious_area"].fillna(0.5)
+        # Categorical codes let the grouping and comparisons below work on integers
+        joined[analysis_column] = (
+            joined[analysis_column]
+            .fillna("unknown")
+            .astype("category")
+            .cat.remove_unused_categories()
+        )
+        joined["imperviousness_coefficient"] = joined["imperviousness_coefficient"].fillna(0.5)
 
         # Calculate statistics by land use category
         stats = (
-            joined.groupby(analysis_column)
+            joined.groupby(analysis_column, observed=True)
             .agg(
-                {"temperature": ["mean", "std", "count", "min", "max"], "impervious_area": ["mean"]}
+                {
+                    "temperature": ["mean", "std", "count", "min", "max"],
+                    "imperviousness_coefficient": ["mean"],
+                }
             )
             .round(2)
         )
@@ -552,63 +819,65 @@ class UrbanHeatIslandAnalyzer:
 
         # Calculate correlations between landuse categories and temperature
         correlations = {}
-        unique_types = joined[analysis_column].unique()
-
-        # Calculate mean temperature for each landuse category
-        category_temp_means = {}
-        for ltype in unique_types:
-            if pd.isna(ltype) or ltype == "unknown":
-                continue
-
-            mask = joined[analysis_column] == ltype
-            type_temps = joined[mask]["temperature"].dropna()
-
-            if len(type_temps) > 0:
-                category_temp_means[ltype] = type_temps.mean()
-
-                # For individual categories, we'll use the difference from overall mean
-                # as a measure of warming/cooling effect
-                overall_mean = joined["temperature"].mean()
-                temp_diff = type_temps.mean() - overall_mean
-
-                # Create a correlation-like metric based on temperature difference
-                # Positive = warming effect, Negative = cooling effect
-                # Normalize by standard deviation for scale
-                overall_std = joined["temperature"].std()
-                if overall_std > 0:
-                    correlation_metric = temp_diff / overall_std
-                    # Cap at [-1, 1] range like correlation
-                    correlation_metric = max(-1.0, min(1.0, correlation_metric))
-                else:
-                    correlation_metric = 0.0
-
-                correlations[ltype] = {
-                    "correlation": round(correlation_metric, 3),
-                    "p_value": 0.001
-                    if abs(correlation_metric) > 0.1
-                    else 1.0,  # Simplified significance
-                    "n_samples": len(type_temps),
-                    "mean_temp": round(type_temps.mean(), 2),
-                    "temp_diff": round(temp_diff, 2),
-                }
+        unique_types = joined[analysis_column].cat.categories
 
-                self.logger.info(
-                    f"Category {ltype}: mean_temp={type_temps.mean():.1f}°C, "
-                    f"diff_from_overall={temp_diff:.1f}°C, correlation_metric={correlation_metric:.3f}"
-                )
+        # Calculate mean temperature for each landuse category in one grouped pass
+        category_summary = (
+            joined.loc[joined[analysis_column] != "unknown"]
+            .groupby(analysis_column, sort=False, observed=True)["temperature"]
+            .agg(mean_temp="mean", n_samples="count")
+        )
+        category_summary = category_summary[category_summary["n_samples"] > 0].copy()
+
+        # For individual categories, we'll use the difference from overall mean
+        # as a measure of warming/cooling effect
+        overall_mean = joined["temperature"].mean()
+        overall_std = joined["temperature"].std()
+        category_summary["temp_diff"] = category_summary["mean_temp"] - overall_mean
+
+        # Create a correlation-like metric based on temperature difference
+        # Positive = warming effect, Negative = cooling effect
+        # Normalize by standard deviation for scale and cap at [-1, 1] range like correlation
+        if overall_std > 0:
+            category_summary["correlation"] = (category_summary["temp_diff"] / overall_std).clip(
+                -1.0, 1.0
+            )
+        else:
+            category_summary["correlation"] = 0.0
+
+        for row in category_summary.itertuples():
+            correlations[row.Index] = {
+                "correlation": round(row.correlation, 3),
+                "p_value": 0.001 if abs(row.correlation) > 0.1 else 1.0,  # Simplified significance
+                "n_samples": int(row.n_samples),
+                "mean_temp": round(row.mean_temp, 2),
+                "temp_diff": round(row.temp_diff, 2),
+            }
+
+            self.logger.info(
+                f"Category {row.Index}: mean_temp={row.mean_temp:.1f}°C, "
+                f"diff_from_overall={row.temp_diff:.1f}°C, "
+                f"correlation_metric={row.correlation:.3f}"
+            )
 
         # Overall correlation - also check for constant arrays
-        valid_overall = (~pd.isna(joined["temperature"])) & (~pd.isna(joined["impervious_area"]))
-        valid_overall_temp = joined[valid_overall]["temperature"]
-        valid_overall_imperv = joined[valid_overall]["impervious_area"]
+        valid_overall = (
+            joined[["temperature", "imperviousness_coefficient"]].notna().all(axis=1).to_numpy()
+        )
+        valid_overall_temp = joined["temperature"].to_numpy(dtype=np.float64)[valid_overall]
+        valid_overall_imperv = joined["imperviousness_coefficient"].to_numpy(dtype=np.float64)[
+            valid_overall
+        ]
 
         if len(valid_overall_temp) > 1:
-            temp_variance = valid_overall_temp.var()
-            imperv_variance = valid_overall_imperv.var()
+            temp_variance = valid_overall_temp.var(ddof=1)
+            imperv_variance = valid_overall_imperv.var(ddof=1)
 
             if temp_variance > 1e-10 and imperv_variance > 1e-10:  # Non-constant arrays
                 try:
-                    overall_corr, overall_p = pearsonr(valid_overall_temp, valid_overall_imperv)
+                    overall_corr, overall_p = _pearson_correlation(
+                        valid_overall_temp, valid_overall_imperv
+                    )
                     correlations["overall"] = {
                         "correlation": round(overall_corr, 3),
                         "p_value": round(overall_p, 3),
@@ -668,13 +937,31 @@ class UrbanHeatIslandAnalyzer:
 
         self.logger.info("Identifying heat island hotspots")
 
-        # Calculate spatial weights with warning suppression for disconnected components
-        with warnings.catch_warnings():
-            # Suppress specific warning about disconnected components - this is normal for irregular geometries
-            warnings.filterwarnings(
-                "ignore", message="The weights matrix is not fully connected", category=UserWarning
+        # A flat temperature field cannot contain heat islands; skip weights and Moran's I.
+        # The conditional moments also need at least three cells with data
+        temperatures = temp_data.temperature.to_numpy(dtype=np.float32)
+        finite = np.isfinite(temperatures)
+        valid_temperatures = temperatures[finite]
+        if valid_temperatures.size < 3 or valid_temperatures.std() < 0.1:
+            self.logger.warning(
+                "Too few valid cells or temperature variability below 0.1°C - "
+                "no heat island hotspots identified"
             )
-            weights = libpysal.weights.Queen.from_dataframe(temp_data, use_index=True)
+            hotspots = temp_data.iloc[:0].copy()
+            hotspots["cluster_id"] = pd.Series(dtype="int")
+            return hotspots
+
+        # Reuse the spatial weights while the analysis grid stays the same; frames that
+        # did not come from _create_analysis_grid always get fresh weights
+        grid_key = temp_data.attrs.get("analysis_grid_key")
+        weights_key = (grid_key, len(temp_data)) if grid_key is not None else None
+        weights = self._weights_cache.get(weights_key) if weights_key is not None else None
+        if weights is None:
+            # Disconnected components are normal for irregular boundaries; the builder
+            # silences libpysal's connectivity warning itself
+            weights = _queen_weights(temp_data.geometry)
+            if weights_key is not None:
+                self._weights_cache = {weights_key: weights}
 
         # Log information about connectivity
         if hasattr(weights, "n_components") and weights.n_components > 1:
@@ -682,30 +969,58 @@ class UrbanHeatIslandAnalyzer:
                 f"Spatial weights matrix has {weights.n_components} disconnected components (normal for irregular boundaries)"
             )
 
-        # Calculate local Moran's I
-        moran_loc = esda.moran.Moran_Local(temp_data.temperature, weights)
+        # Cells without data (nodata, failed strips) are removed from the graph before
+        # row standardization, so they are neither neighbours nor flagged themselves
+        adjacency = weights.sparse.tocsr()
+        valid_positions = np.flatnonzero(finite)
+        valid_adjacency = adjacency[valid_positions][:, valid_positions].tocsr()
+        valid_adjacency.sort_indices()
+
+        # Calculate local Moran's I z-scores on row-standardized weights, either from the
+        # exact conditional moments or from an explicit permutation run
+        neighbour_counts = np.diff(valid_adjacency.indptr)
+        row_weights = (valid_adjacency.data / np.repeat(neighbour_counts, neighbour_counts)).astype(
+            np.float32
+        )
+        centred = valid_temperatures - valid_temperatures.mean()
+        if self.hotspot_permutations > 0:
+            _, valid_z_scores = _local_moran_permutations(
+                valid_adjacency.indptr,
+                valid_adjacency.indices,
+                row_weights,
+                centred,
+                self.hotspot_permutations,
+                0,
+            )
+        else:
+            standardized = csr_matrix(
+                (row_weights, valid_adjacency.indices, valid_adjacency.indptr),
+                shape=valid_adjacency.shape,
+            )
+            valid_z_scores = _local_moran_conditional(standardized, centred)
+        p_values = np.ones(len(temperatures))
+        p_values[valid_positions] = ndtr(-np.abs(valid_z_scores))
+
+        # Temperature cutoff at the threshold quantile (linear interpolation, NaN skipped),
+        # selected with a partial sort instead of a full one
+        position = threshold * (valid_temperatures.size - 1)
+        lower = int(position)
+        upper = min(lower + 1, valid_temperatures.size - 1)
+        partitioned = np.partition(valid_temperatures, (lower, upper))
+        cutoff = partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (position - lower)
 
         # Identify significant hot spots
-        hotspots = temp_data[
-            (moran_loc.p_sim < 0.05)
-            & (temp_data.temperature > temp_data.temperature.quantile(threshold))
-        ].copy()
+        hotspot_positions = np.flatnonzero((p_values < 0.05) & (temperatures > cutoff))
+        hotspots = temp_data.iloc[hotspot_positions].copy()
 
         # Cluster contiguous hot spots
         if hotspots.empty:
             hotspots["cluster_id"] = pd.Series(dtype="int")
             valid_clusters = []
         else:
-            # Suppress warning for disconnected components in w_subset - normal for hotspot analysis
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore",
-                    message="The weights matrix is not fully connected",
-                    category=UserWarning,
-                )
-                hotspot_weights = libpysal.weights.w_subset(weights, hotspots.index)
-
-            hotspots["cluster_id"] = self._cluster_hotspots(hotspot_weights)
+            # Slice the hotspot subgraph directly from the contiguity matrix
+            hotspot_adjacency = adjacency[hotspot_positions][:, hotspot_positions]
+            hotspots["cluster_id"] = self._cluster_hotspots(hotspot_adjacency)
 
             # Filter small clusters
             valid_clusters = hotspots.cluster_id.value_counts()
@@ -717,14 +1032,14 @@ class UrbanHeatIslandAnalyzer:
         )
         return hotspots
 
-    def _cluster_hotspots(self, weights: libpysal.weights.W) -> np.ndarray:
+    def _cluster_hotspots(self, adjacency: csr_matrix) -> np.ndarray:
         """Cluster contiguous hot spots using connected components."""
-        from scipy.sparse.csgraph import connected_components
-
-        adj_matrix = weights.sparse
-        if adj_matrix.shape[0] == 0:
+        if adjacency.shape[0] == 0:
             return np.array([])
-        n_components, labels = connected_components(adj_matrix, directed=False)
+        if adjacency.nnz == 0:
+            # Isolated hot spots each form their own cluster
+            return np.arange(adjacency.shape[0])
+        n_components, labels = connected_components(adjacency, directed=False, return_labels=True)
         return labels
 
     def _validate_with_ground_data(
@@ -778,8 +1093,27 @@ class UrbanHeatIslandAnalyzer:
                     "available_columns": list(satellite_temps.columns),
                 }
 
-            # Spatial join between satellite grid and weather stations
-            joined = gpd.sjoin_nearest(station_data, satellite_temps, how="inner")
+            # Spatial join between satellite grid and weather stations, limited to stations
+            # within one grid-cell diagonal so distant stations do not search the whole tree
+            cell_bounds = shapely.bounds(satellite_temps.geometry.values)
+            cell_diagonals = np.hypot(
+                cell_bounds[:, 2] - cell_bounds[:, 0], cell_bounds[:, 3] - cell_bounds[:, 1]
+            )
+            cell_diagonal = float(np.nanmax(cell_diagonals, initial=0.0))
+            joined = gpd.sjoin_nearest(
+                station_data,
+                satellite_temps,
+                how="inner",
+                max_distance=cell_diagonal if cell_diagonal > 0 else None,
+                distance_col="match_dist",
+            )
+
+            unmatched_stations = len(station_data) - joined.index.nunique()
+            if unmatched_stations > 0:
+                self.logger.info(
+                    f"{unmatched_stations} weather stations lie more than {cell_diagonal:.0f} m "
+                    "from the satellite grid and were skipped"
+                )
 
             if len(joined) == 0:
                 self.logger.warning(
@@ -789,6 +1123,7 @@ class UrbanHeatIslandAnalyzer:
                     "error": "No spatial matches found",
                     "station_count": len(station_data),
                     "satellite_cells": len(satellite_temps),
+                    "max_match_distance": cell_diagonal,
                 }
 
             # Rename columns for consistency
@@ -796,25 +1131,29 @@ class UrbanHeatIslandAnalyzer:
                 columns={station_temp_col: "ground_temp", "temperature": "satellite_temp"}
             )
 
-            # Remove rows with missing temperature data
-            valid_mask = (~pd.isna(joined["ground_temp"])) & (~pd.isna(joined["satellite_temp"]))
-            valid_data = joined[valid_mask]
+            # Remove pairs with missing temperature data
+            ground_temps = joined["ground_temp"].to_numpy(dtype=np.float32)
+            satellite_temps_vals = joined["satellite_temp"].to_numpy(dtype=np.float32)
+            ground_valid = np.isfinite(ground_temps)
+            satellite_valid = np.isfinite(satellite_temps_vals)
+            valid_mask = ground_valid & satellite_valid
+            n_valid = int(np.count_nonzero(valid_mask))
 
-            if len(valid_data) == 0:
+            if n_valid == 0:
                 self.logger.warning("No valid temperature pairs found after removing NaN values")
                 return {
                     "error": "No valid temperature pairs found",
                     "total_matches": len(joined),
-                    "ground_nan_count": pd.isna(joined["ground_temp"]).sum(),
-                    "satellite_nan_count": pd.isna(joined["satellite_temp"]).sum(),
+                    "ground_nan_count": int(len(joined) - np.count_nonzero(ground_valid)),
+                    "satellite_nan_count": int(len(joined) - np.count_nonzero(satellite_valid)),
                 }
 
             # Calculate validation metrics
-            ground_temps = valid_data["ground_temp"].values
-            satellite_temps_vals = valid_data["satellite_temp"].values
+            ground_temps = ground_temps[valid_mask]
+            satellite_temps_vals = satellite_temps_vals[valid_mask]
 
             # Log diagnostic information
-            self.logger.info(f"Validation data: {len(valid_data)} temperature pairs")
+            self.logger.info(f"Validation data: {n_valid} temperature pairs")
             self.logger.info(
                 f"Ground temperature range: {ground_temps.min():.1f}°C to {ground_temps.max():.1f}°C (σ={np.std(ground_temps):.2f})"
             )
@@ -822,9 +1161,11 @@ class UrbanHeatIslandAnalyzer:
                 f"Satellite temperature range: {satellite_temps_vals.min():.1f}°C to {satellite_temps_vals.max():.1f}°C (σ={np.std(satellite_temps_vals):.2f})"
             )
 
-            rmse = np.sqrt(((satellite_temps_vals - ground_temps) ** 2).mean())
-            mae = np.abs(satellite_temps_vals - ground_temps).mean()
-            bias = (satellite_temps_vals - ground_temps).mean()
+            diff = satellite_temps_vals - ground_temps
+            rmse = np.sqrt(np.dot(diff, diff) / n_valid)
+            bias = diff.mean()
+            np.abs(diff, out=diff)
+            mae = diff.mean()
 
             # Calculate correlation with improved robustness
             correlation = np.nan
@@ -841,7 +1182,7 @@ class UrbanHeatIslandAnalyzer:
                 if (
                     ground_std > 0.1 and satellite_std > 0.1
                 ):  # Require at least 0.1°C standard deviation
-                    correlation, p_value = pearsonr(ground_temps, satellite_temps_vals)
+                    correlation, p_value = _pearson_correlation(ground_temps, satellite_temps_vals)
                     self.logger.info(
                         f"Correlation calculation successful: r={correlation:.3f}, p={p_value:.3f}"
                     )
@@ -864,22 +1205,23 @@ class UrbanHeatIslandAnalyzer:
             r_squared = correlation**2 if not np.isnan(correlation) else np.nan
 
             results = {
-                "rmse": round(rmse, 2),
-                "mae": round(mae, 2),
-                "bias": round(bias, 2),
+                "rmse": round(float(rmse), 2),
+                "mae": round(float(mae), 2),
+                "bias": round(float(bias), 2),
                 "correlation": round(correlation, 3) if not np.isnan(correlation) else None,
                 "r_squared": round(r_squared, 3) if not np.isnan(r_squared) else None,
                 "p_value": round(p_value, 3) if not np.isnan(p_value) else None,
-                "n_pairs": len(valid_data),
+                "n_pairs": n_valid,
+                "unmatched_stations": unmatched_stations,
                 "ground_temp_range": {
-                    "min": round(ground_temps.min(), 1),
-                    "max": round(ground_temps.max(), 1),
-                    "mean": round(ground_temps.mean(), 1),
+                    "min": round(float(ground_temps.min()), 1),
+                    "max": round(float(ground_temps.max()), 1),
+                    "mean": round(float(ground_temps.mean()), 1),
                 },
                 "satellite_temp_range": {
-                    "min": round(satellite_temps_vals.min(), 1),
-                    "max": round(satellite_temps_vals.max(), 1),
-                    "mean": round(satellite_temps_vals.mean(), 1),
+                    "min": round(float(satellite_temps_vals.min()), 1),
+                    "max": round(float(satellite_temps_vals.max()), 1),
+                    "mean": round(float(satellite_temps_vals.mean()), 1),
                 },
             }
 
@@ -917,35 +1259,28 @@ class UrbanHeatIslandAnalyzer:
             )
             return recommendations
 
-        # A) Größenbasierte Strategien
-        size_recommendations = self._generate_size_based_recommendations(hotspots)
-        recommendations.extend(size_recommendations)
-
-        # B) Intensitätsbasierte Priorisierung
-        intensity_recommendations = self._generate_intensity_based_recommendations(hotspots)
-        recommendations.extend(intensity_recommendations)
-
-        # C) Landnutzungs-spezifische Empfehlungen
-        landuse_recommendations = self._generate_landuse_specific_recommendations(hotspots, results)
-        recommendations.extend(landuse_recommendations)
-
-        # D) Korrelationsbasierte Strategien
-        correlation_recommendations = self._generate_correlation_based_recommendations(
-            landuse_correlation
+        recommendations = list(
+            itertools.chain(
+                # A) Größenbasierte Strategien
+                self._generate_size_based_recommendations(hotspots),
+                # B) Intensitätsbasierte Priorisierung
+                self._generate_intensity_based_recommendations(hotspots),
+                # C) Landnutzungs-spezifische Empfehlungen
+                self._generate_landuse_specific_recommendations(hotspots, results),
+                # D) Korrelationsbasierte Strategien
+                self._generate_correlation_based_recommendations(landuse_correlation),
+            )
         )
-        recommendations.extend(correlation_recommendations)
 
         self.logger.info(
             f"Generated {len(recommendations)} comprehensive mitigation recommendations"
         )
         return recommendations
 
-    def _generate_size_based_recommendations(self, hotspots: gpd.GeoDataFrame) -> list[dict]:
+    def _generate_size_based_recommendations(self, hotspots: gpd.GeoDataFrame) -> Iterator[dict]:
         """Generate recommendations based on hotspot cluster sizes (number of grid cells)."""
-        recommendations = []
-
         if hotspots.empty:
-            return recommendations
+            return
 
         # Analysiere Cluster-Größen basierend auf räumlicher Nähe
         # Da Hotspots aus einem Grid stammen, nutzen wir die Anzahl der zusammenhängenden Zellen
@@ -958,222 +1293,170 @@ class UrbanHeatIslandAnalyzer:
 
         if total_hotspots <= 5:
             # Wenige isolierte Hotspots -> Mikro-Interventionen
-            recommendations.append(
-                {
-                    "strategy": "Punktuelle Kühlungsmaßnahmen",
-                    "description": f"{total_hotspots} isolierte Hitzezellen identifiziert. Empfehlung: Einzelbäume, kleine Grünstreifen und vertikale Begrünung.",
-                    "priority": "medium",
-                    "category": "micro_interventions",
-                    "affected_areas": total_hotspots,
-                }
-            )
+            yield {
+                "strategy": "Punktuelle Kühlungsmaßnahmen",
+                "description": f"{total_hotspots} isolierte Hitzezellen identifiziert. Empfehlung: Einzelbäume, kleine Grünstreifen und vertikale Begrünung.",
+                "priority": "medium",
+                "category": "micro_interventions",
+                "affected_areas": total_hotspots,
+            }
 
         elif total_hotspots <= 20:
             # Moderate Anzahl -> kleinere Cluster, Quartiersansätze
             avg_cluster_size = total_hotspots // max(1, total_hotspots // 5)  # Geschätzte Cluster
-            recommendations.append(
-                {
-                    "strategy": "Quartiersansätze",
-                    "description": f"{total_hotspots} Hitzezellen in ca. {total_hotspots // max(1, avg_cluster_size)} Bereichen. Empfehlung: Pocket Parks, Dachbegrünung und klimaresiliente Straßengestaltung.",
-                    "priority": "high",
-                    "category": "neighborhood_interventions",
-                    "affected_areas": total_hotspots,
-                }
-            )
+            yield {
+                "strategy": "Quartiersansätze",
+                "description": f"{total_hotspots} Hitzezellen in ca. {total_hotspots // max(1, avg_cluster_size)} Bereichen. Empfehlung: Pocket Parks, Dachbegrünung und klimaresiliente Straßengestaltung.",
+                "priority": "high",
+                "category": "neighborhood_interventions",
+                "affected_areas": total_hotspots,
+            }
 
         else:
             # Viele Hotspots -> größere zusammenhängende Bereiche
             estimated_clusters = max(1, total_hotspots // 10)  # Geschätzte große Cluster
-            recommendations.append(
-                {
-                    "strategy": "Strategische Grüninfrastruktur",
-                    "description": f"{total_hotspots} Hitzezellen in ca. {estimated_clusters} Großbereichen. Empfehlung: Grünkorridore, urbane Wasserflächen und großflächige Verschattung.",
-                    "priority": "critical",
-                    "category": "strategic_interventions",
-                    "affected_areas": total_hotspots,
-                }
-            )
+            yield {
+                "strategy": "Strategische Grüninfrastruktur",
+                "description": f"{total_hotspots} Hitzezellen in ca. {estimated_clusters} Großbereichen. Empfehlung: Grünkorridore, urbane Wasserflächen und großflächige Verschattung.",
+                "priority": "critical",
+                "category": "strategic_interventions",
+                "affected_areas": total_hotspots,
+            }
 
         # Zusätzliche Empfehlung basierend auf Hotspot-Dichte
         if total_hotspots > 50:
-            recommendations.append(
-                {
-                    "strategy": "Stadtweites Kühlungskonzept",
-                    "description": f"{total_hotspots} Hitzezellen erfordern koordinierte Gesamtstrategie. Empfehlung: Vernetzte Grün-Blau-Infrastruktur und klimaadaptives Stadtdesign.",
-                    "priority": "critical",
-                    "category": "city_wide_cooling",
-                    "affected_areas": total_hotspots,
-                }
-            )
-
-        return recommendations
+            yield {
+                "strategy": "Stadtweites Kühlungskonzept",
+                "description": f"{total_hotspots} Hitzezellen erfordern koordinierte Gesamtstrategie. Empfehlung: Vernetzte Grün-Blau-Infrastruktur und klimaadaptives Stadtdesign.",
+                "priority": "critical",
+                "category": "city_wide_cooling",
+                "affected_areas": total_hotspots,
+            }
 
-    def _generate_intensity_based_recommendations(self, hotspots: gpd.GeoDataFrame) -> list[dict]:
+    def _generate_intensity_based_recommendations(
+        self, hotspots: gpd.GeoDataFrame
+    ) -> Iterator[dict]:
         """Generate recommendations based on temperature intensity."""
-        recommendations = []
-
         if hotspots.empty or "temperature" not in hotspots.columns:
-            return recommendations
+            return
 
-        temperatures = hotspots["temperature"]
+        temperatures = hotspots["temperature"].to_numpy(dtype=np.float64)
+        temperatures = temperatures[np.isfinite(temperatures)]
+        if temperatures.size == 0:
+            return
         mean_temp = temperatures.mean()
 
-        weak_hotspots = len(temperatures[temperatures < mean_temp + 1])
-        strong_hotspots = len(temperatures[temperatures >= mean_temp + 1])
+        strong_hotspots = int(np.count_nonzero(temperatures >= mean_temp + 1))
+        weak_hotspots = temperatures.size - strong_hotspots
 
         if weak_hotspots > 0:
-            recommendations.append(
-                {
-                    "strategy": "Moderate Kühlungsmaßnahmen",
-                    "description": f"{weak_hotspots} Bereiche mit moderater Überwärmung. Empfehlung: Helle Oberflächen, Verschattung und gezielte Begrünung.",
-                    "priority": "medium",
-                    "category": "prevention",
-                    "affected_areas": weak_hotspots,
-                }
-            )
+            yield {
+                "strategy": "Moderate Kühlungsmaßnahmen",
+                "description": f"{weak_hotspots} Bereiche mit moderater Überwärmung. Empfehlung: Helle Oberflächen, Verschattung und gezielte Begrünung.",
+                "priority": "medium",
+                "category": "prevention",
+                "affected_areas": weak_hotspots,
+            }
 
         if strong_hotspots > 0:
-            recommendations.append(
-                {
-                    "strategy": "Intensive Kühlungsmaßnahmen",
-                    "description": f"{strong_hotspots} starke Hitzeinseln (>{mean_temp + 1:.1f}°C). Empfehlung: Kombinierte Strategien aus Begrünung, Wasserelementen und Verschattung.",
-                    "priority": "critical",
-                    "category": "acute_intervention",
-                    "affected_areas": strong_hotspots,
-                }
-            )
-
-        return recommendations
+            yield {
+                "strategy": "Intensive Kühlungsmaßnahmen",
+                "description": f"{strong_hotspots} starke Hitzeinseln (>{mean_temp + 1:.1f}°C). Empfehlung: Kombinierte Strategien aus Begrünung, Wasserelementen und Verschattung.",
+                "priority": "critical",
+                "category": "acute_intervention",
+                "affected_areas": strong_hotspots,
+            }
 
     def _generate_landuse_specific_recommendations(
         self, hotspots: gpd.GeoDataFrame, results: dict
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """Generate recommendations based on dominant land use in hotspot areas."""
-        recommendations = []
-
-        # Landnutzungs-spezifische Empfehlungsmatrix
-        landuse_strategies = {
-            "dichte_bebauung": {
-                "strategy": "Urbane Verdichtung kühlen",
-                "description": "Dicht bebaute Bereiche: Dach- und Fassadenbegrünung, kühle Materialien und vertikale Gärten.",
-                "priority": "critical",
-            },
-            "wohngebiete": {
-                "strategy": "Wohnquartiere optimieren",
-                "description": "Wohnbereiche: Straßenbäume, private Gartenbegrünung, Hofentsiegelung und Wasserspiele.",
-                "priority": "high",
-            },
-            "industrie": {
-                "strategy": "Gewerbeflächen optimieren",
-                "description": "Industriegebiete: Extensive Dachbegrünung, Parkplatzentsiegelung und Verschattungsanlagen.",
-                "priority": "high",
-            },
-            "verkehrsflaechen": {
-                "strategy": "Verkehrsflächen kühlen",
-                "description": "Verkehrsbereiche: Straßenbegleitgrün, helle Fahrbahnbeläge und Baumalleen.",
-                "priority": "medium",
-            },
-            "staedtisches_gruen": {
-                "strategy": "Grünflächen stärken",
-                "description": "Grünbereiche: Verstärkte Bewässerung, schattenspendende Bäume und Wasserflächen.",
-                "priority": "low",
-            },
-        }
-
         # Analysiere verfügbare Landnutzungsdaten
         landuse_data = results.get("raw_landcover_data")
         if (
             landuse_data is not None
             and not landuse_data.empty
-            and "landuse_type" in landuse_data.columns
+            and "landuse_category" in landuse_data.columns
         ):
             # Finde dominante Landnutzung in Hotspot-Gebieten
-            dominant_landuses = landuse_data["landuse_type"].value_counts().head(3)
+            landuse_counts = landuse_data["landuse_category"].value_counts()
+            dominant_landuses = landuse_counts[landuse_counts > 0].head(3)
 
             for landuse, count in dominant_landuses.items():
-                if landuse in landuse_strategies:
-                    strategy = landuse_strategies[landuse].copy()
+                template = _LANDUSE_STRATEGIES.get(landuse)
+                if template is not None:
+                    strategy = template.copy()
                     strategy["description"] += f" ({count} Flächen betroffen)"
                     strategy["category"] = "landuse_specific"
                     strategy["landuse_type"] = landuse
-                    recommendations.append(strategy)
+                    yield strategy
 
-        return recommendations
-
-    def _generate_correlation_based_recommendations(self, landuse_correlation: dict) -> list[dict]:
+    def _generate_correlation_based_recommendations(
+        self, landuse_correlation: dict
+    ) -> Iterator[dict]:
         """Generate recommendations based on land use temperature correlations."""
-        recommendations = []
-
         correlations = landuse_correlation.get("correlations", {})
 
         # Suche nach hoher Korrelation zwischen Versiegelung und Temperatur
         high_correlation_found = False
 
-        for category, correlation_data in correlations.items():
-            if isinstance(correlation_data, dict) and "correlation" in correlation_data:
-                correlation_value = correlation_data["correlation"]
-
-                # Hohe positive Korrelation mit Temperatur -> wärmend
-                if correlation_value > 0.6:
-                    if category in ["dichte_bebauung", "verkehrsflaechen", "industrie"]:
-                        recommendations.append(
-                            {
-                                "strategy": "Entsiegelungsstrategie",
-                                "description": f"Starke Temperaturkorrelation bei {category} (r={correlation_value:.2f}). Empfehlung: Entsiegelung und reflektierende Materialien.",
-                                "priority": "critical",
-                                "category": "desealing",
-                                "correlation_strength": correlation_value,
-                                "landuse_type": category,
-                            }
-                        )
-                        high_correlation_found = True
-
-                # Starke negative Korrelation -> kühlend, erhalten/verstärken
-                elif correlation_value < -0.4 and category in [
-                    "wald",
-                    "wasser",
-                    "staedtisches_gruen",
-                ]:
-                    # Bessere Kategoriebeschreibung
-                    category_names = {
-                        "wald": "Wald und natürlicher Vegetation",
-                        "wasser": "Gewässern",
-                        "staedtisches_gruen": "städtischem Grün",
+        # Nur Kategorien mit Korrelationswert, wärmende bzw. kühlende Klassen per Set-Lookup
+        scored_categories = [
+            (category, correlation_data["correlation"])
+            for category, correlation_data in correlations.items()
+            if isinstance(correlation_data, dict) and "correlation" in correlation_data
+        ]
+
+        for category, correlation_value in scored_categories:
+            # Hohe positive Korrelation mit Temperatur -> wärmend
+            if correlation_value > 0.6:
+                if category in _WARMING_LANDUSES:
+                    category_display = UHI_CATEGORY_DESCRIPTIONS_DE[category]
+                    yield {
+                        "strategy": "Entsiegelungsstrategie",
+                        "description": f"Starke Temperaturkorrelation bei {category_display} (r={correlation_value:.2f}). Empfehlung: Entsiegelung und reflektierende Materialien.",
+                        "priority": "critical",
+                        "category": "desealing",
+                        "correlation_strength": correlation_value,
+                        "landuse_type": category,
                     }
-                    category_display = category_names.get(category, category)
-
-                    recommendations.append(
-                        {
-                            "strategy": "Kühlflächen ausbauen",
-                            "description": f"Kühlende Wirkung bei {category_display} (r={correlation_value:.2f}). Empfehlung: Schutz und Erweiterung dieser Flächen.",
-                            "priority": "high",
-                            "category": "cooling_enhancement",
-                            "correlation_strength": abs(correlation_value),
-                            "landuse_type": category,
-                        }
-                    )
+                    high_correlation_found = True
 
-        # Fallback-Empfehlung wenn keine starken Korrelationen gefunden
-        if not high_correlation_found and correlations:
-            recommendations.append(
-                {
-                    "strategy": "Integrierte Kühlung",
-                    "description": "Moderate Temperaturkorrelationen gefunden. Empfehlung: Kombinierte Ansätze aus Begrünung, Verschattung und Oberflächenmodifikation.",
-                    "priority": "medium",
-                    "category": "integrated_cooling",
+            # Starke negative Korrelation -> kühlend, erhalten/verstärken
+            elif correlation_value < -0.4 and category in _COOLING_LANDUSE_NAMES:
+                category_display = _COOLING_LANDUSE_NAMES[category]
+
+                yield {
+                    "strategy": "Kühlflächen ausbauen",
+                    "description": f"Kühlende Wirkung bei {category_display} (r={correlation_value:.2f}). Empfehlung: Schutz und Erweiterung dieser Flächen.",
+                    "priority": "high",
+                    "category": "cooling_enhancement",
+                    "correlation_strength": abs(correlation_value),
+                    "landuse_type": category,
                 }
-            )
 
-        return recommendations
+        # Fallback-Empfehlung wenn keine starken Korrelationen gefunden
+        if not high_correlation_found and correlations:
+            yield {
+                "strategy": "Integrierte Kühlung",
+                "description": "Moderate Temperaturkorrelationen gefunden. Empfehlung: Kombinierte Ansätze aus Begrünung, Verschattung und Oberflächenmodifikation.",
+                "priority": "medium",
+                "category": "integrated_cooling",
+            }
 
     def _calculate_area_km2(self, gdf: gpd.GeoDataFrame) -> float:
         """Calculate the area of a GeoDataFrame in square kilometers."""
-        # Ensure the GeoDataFrame is in a projected CRS for accurate area calculation
-        if gdf.crs is None or gdf.crs.is_geographic:
-            gdf = gdf.to_crs(CRS_CONFIG["WEB_MERCATOR"])
-
         # Calculate the total area in square meters
-        total_area_m2 = gdf.geometry.area.sum()
+        if gdf.crs is None or gdf.crs.is_geographic:
+            # Geodesic area on the CRS ellipsoid, without reprojecting any vertices
+            geod = gdf.crs.get_geod() if gdf.crs is not None else Geod(ellps="WGS84")
+            total_area_m2 = np.fromiter(
+                (abs(geod.geometry_area_perimeter(geom)[0]) for geom in gdf.geometry.values),
+                dtype=np.float64,
+                count=len(gdf),
+            ).sum()
+        else:
+            total_area_m2 = gdf.geometry.area.sum()
 
         # Convert to square kilometers
         total_area_km2 = total_area_m2 / 1e6
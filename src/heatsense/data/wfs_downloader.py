@@ -6,14 +6,28 @@ WFS endpoints with automatic retry logic and error handling. Commonly used for
 administrative boundaries and reference datasets.
 """
 
+import hashlib
+import json
 import logging
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from urllib.parse import urlencode
 from xml.etree import ElementTree as ET
 
 import geopandas as gpd
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# Upper bound on feature types per batched request, so one slow layer cannot stall many
+_MAX_BATCH_TYPE_NAMES = 5
+
+# HTTP status codes that indicate a transient server condition worth retrying
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
 
 class WFSDataDownloader:
@@ -29,7 +43,11 @@ class WFSDataDownloader:
         timeout: Request timeout in seconds (default: 30)
         max_features: Default maximum features per request (default: 10000)
         retry_attempts: Number of retry attempts for failed requests (default: 3)
-        retry_delay: Initial retry delay in seconds (default: 2)
+        retry_delay: Backoff factor in seconds; retries wait 0, 2x, 4x, ... this value
+            (default: 2)
+        max_workers: Concurrent requests for multi-layer downloads (default: 4)
+        cache_dir: Optional directory for caching WFS responses on disk
+        cache_ttl: Seconds a cached response is used without revalidation (default: 7 days)
         log_file: Optional path for detailed logging
         verbose: Enable console progress logging
     """
@@ -42,6 +60,9 @@ class WFSDataDownloader:
         max_features: int = 10000,
         retry_attempts: int = 3,
         retry_delay: int = 2,
+        max_workers: int = 4,
+        cache_dir: str | Path | None = None,
+        cache_ttl: int = 7 * 24 * 3600,
         log_file: str | None = None,
         verbose: bool = True,
     ):
@@ -49,16 +70,52 @@ class WFSDataDownloader:
         self.headers = headers or {
             "User-Agent": "HeatSense-WFS-Client/1.0",
             "Accept": "application/json",
+            # Only codecs urllib3 can decode here; brotli/zstd join when installed
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
         }
         self.timeout = timeout
         self.max_features = max_features
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
+        self.max_workers = max(1, max_workers)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+
+        # Persistent session so TCP/TLS connections are reused across requests
+        self._session = requests.Session()
+        # Transient failures are retried inside the adapter with urllib3's exponential
+        # backoff (immediately, then 2 * retry_delay, 4 * retry_delay, ... capped at
+        # 120 s) that honours Retry-After on 429/503
+        retry = Retry(
+            total=max(0, retry_attempts - 1),
+            backoff_factor=retry_delay,
+            status_forcelist=_RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=max(16, self.max_workers), max_retries=retry
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self.headers)
+
         self.logger = self._setup_logger(log_file) if verbose or log_file else None
 
         if self.logger:
             self.logger.info(f"WFS Downloader initialized for {self.endpoint_url}")
 
+    def close(self) -> None:
+        """Close the HTTP session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "WFSDataDownloader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _setup_logger(self, log_file: str | None = None) -> logging.Logger:
         """Configure logging with console and optional file output."""
         logger = logging.getLogger(f"{__name__}.WFSDataDownloader")
@@ -108,54 +165,167 @@ class WFSDataDownloader:
             "typeNames": type_name,
             "outputFormat": output_format,
             "outputCrs": target_crs,
+            # WFS 2.0 reprojection parameter, so the server returns target_crs directly
+            "srsName": target_crs,
             "maxFeatures": max_features or self.max_features,
         }
 
         return f"{self.endpoint_url}?{urlencode(params)}"
 
-    def _make_request(self, url: str) -> requests.Response:
-        """Execute HTTP request with exponential backoff retry logic."""
-        last_exception = None
-
-        for attempt in range(self.retry_attempts):
-            try:
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
-                response.raise_for_status()
-                return response
-
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt < self.retry_attempts - 1:
-                    # Exponential backoff
-                    delay = self.retry_delay * (2**attempt)
-                    if self.logger:
-                        self.logger.warning(
-                            f"Request attempt {attempt + 1} failed, retrying in {delay}s"
-                        )
-                    time.sleep(delay)
+    def _make_request(self, url: str, headers: dict | None = None) -> requests.Response:
+        """Execute HTTP request; retries and backoff are handled by the session adapter."""
+        try:
+            response = self._session.get(url, headers=headers, timeout=self.timeout, stream=True)
+        except requests.RequestException:
+            if self.logger:
+                self.logger.error(f"All {self.retry_attempts} request attempts failed")
+            raise
+
+        # Error statuses reach this point either unretried (4xx) or with retries used up
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            if self.logger:
+                self.logger.error(f"WFS request failed with HTTP {response.status_code}")
+            raise
 
-        if self.logger:
-            self.logger.error(f"All {self.retry_attempts} request attempts failed")
-        raise last_exception
+        return response
+
+    def _get_cache_path(self, url: str) -> Path | None:
+        """Build a content-addressed cache path for a WFS request URL."""
+        if self.cache_dir is None:
+            return None
+
+        # The URL already encodes type name, feature limit, CRS and service version
+        digest = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.geojson"
+
+    def _get_revalidation_headers(self, cache_path: Path | None) -> dict | None:
+        """Build conditional request headers from the metadata of a cached response."""
+        if cache_path is None or not cache_path.exists():
+            return None
+
+        meta_path = cache_path.with_suffix(".meta.json")
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers or None
+
+    def _stream_response(
+        self, response: requests.Response, cache_path: Path | None
+    ) -> BytesIO | Path:
+        """Stream a response body into memory, or into a temporary file next to the cache."""
+        chunks = response.iter_content(chunk_size=65536)
+
+        if cache_path is None:
+            buffer = BytesIO()
+            for chunk in chunks:
+                buffer.write(chunk)
+            buffer.seek(0)
+            return buffer
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return Path(f.name)
+
+    def _store_cached_response(
+        self, cache_path: Path, tmp_path: Path, response: requests.Response
+    ) -> None:
+        """Atomically move a streamed response body into the cache and record its validators."""
+        tmp_path.replace(cache_path)
+
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        cache_path.with_suffix(".meta.json").write_text(json.dumps(meta))
 
     def _validate_response(self, response: requests.Response) -> bool:
         """Validate WFS response and detect service exceptions."""
         content_type = response.headers.get("content-type", "").lower()
 
-        # Check for XML-formatted error responses
-        if "xml" in content_type:
-            try:
-                root = ET.fromstring(response.text)
-                if "exception" in root.tag.lower():
-                    if self.logger:
-                        exception_text = root.text or "Unknown WFS exception"
-                        self.logger.error(f"WFS service exception: {exception_text}")
-                    return False
-            except ET.ParseError:
-                # Unable to parse XML, assume valid response
-                pass
-
-        return True
+        # Check for XML-formatted error responses; the root tag sits in the first bytes,
+        # so only documents that mention an exception there are parsed at all
+        if "xml" not in content_type or b"exception" not in response.content[:512].lower():
+            return True
+
+        exception_text = "Unknown WFS exception"
+        try:
+            events = ET.iterparse(BytesIO(response.content), events=("start", "end"))
+            _, root = next(events)
+            if "exception" not in root.tag.lower():
+                return True
+
+            # Stop at the first element carrying text instead of building the whole tree
+            for event, element in events:
+                if event == "end" and element.text and element.text.strip():
+                    exception_text = element.text.strip()
+                    break
+        except ET.ParseError:
+            # Unable to parse XML, assume valid response
+            return True
+
+        if self.logger:
+            self.logger.error(f"WFS service exception: {exception_text}")
+        return False
+
+    def _fetch_geodataframe(self, url: str) -> gpd.GeoDataFrame:
+        """Fetch a GetFeature URL through the cache and parse the response body."""
+        # Serve recent responses from the cache without contacting the service
+        cache_path = self._get_cache_path(url)
+        if (
+            cache_path is not None
+            and cache_path.exists()
+            and time.time() - cache_path.stat().st_mtime < self.cache_ttl
+        ):
+            if self.logger:
+                self.logger.info(f"Loading cached WFS response from {cache_path}")
+            response = None
+        else:
+            # Execute request with retry logic, revalidating an existing cache entry
+            response = self._make_request(url, self._get_revalidation_headers(cache_path))
+
+            if response.status_code == 304:
+                if self.logger:
+                    self.logger.info(f"Cached WFS response is still current: {cache_path}")
+                cache_path.touch()
+                response = None
+
+        # Validate response content
+        if response is not None and not self._validate_response(response):
+            response.close()
+            raise ValueError("WFS service returned an exception or invalid response")
+
+        # Parse response to GeoDataFrame, streaming the body instead of decoding it to text
+        source = cache_path
+        try:
+            if response is not None:
+                source = self._stream_response(response, cache_path)
+            gdf = gpd.read_file(source, engine="pyogrio")
+        except Exception as e:
+            if isinstance(source, Path) and source != cache_path:
+                source.unlink(missing_ok=True)
+            if self.logger:
+                self.logger.error(f"Failed to parse WFS response: {e}")
+            raise ValueError(f"Unable to parse WFS response as GeoDataFrame: {e}") from e
+        finally:
+            if response is not None:
+                response.close()
+
+        if response is not None and cache_path is not None:
+            self._store_cached_response(cache_path, source, response)
+
+        return gdf
 
     def download_to_geodataframe(
         self,
@@ -189,28 +359,15 @@ class WFSDataDownloader:
             type_name=type_name, max_features=max_features, target_crs=target_crs or "EPSG:4326"
         )
 
-        # Execute request with retry logic
-        response = self._make_request(url)
-
-        # Validate response content
-        if not self._validate_response(response):
-            raise ValueError("WFS service returned an exception or invalid response")
-
-        # Parse response to GeoDataFrame
-        try:
-            gdf = gpd.read_file(response.text)
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Failed to parse WFS response: {e}")
-            raise ValueError(f"Unable to parse WFS response as GeoDataFrame: {e}") from e
+        gdf = self._fetch_geodataframe(url)
 
         if gdf.empty:
             if self.logger:
                 self.logger.warning(f"No features found for type '{type_name}'")
             return gdf
 
-        # Apply coordinate transformation if needed
-        if target_crs and gdf.crs and str(gdf.crs) != target_crs:
+        # Reproject client-side only if the server ignored srsName
+        if target_crs and gdf.crs and gdf.crs != target_crs:
             if self.logger:
                 self.logger.info(f"Transforming from {gdf.crs} to {target_crs}")
             gdf = gdf.to_crs(target_crs)
@@ -220,6 +377,151 @@ class WFSDataDownloader:
 
         return gdf
 
+    def download_many(
+        self,
+        type_names: list[str],
+        max_features: int | None = None,
+        target_crs: str | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, gpd.GeoDataFrame]:
+        """
+        Download several WFS feature types concurrently.
+
+        Each feature type is fetched by download_to_geodataframe on a thread pool,
+        so the server-side processing and transfer of the layers overlap instead of
+        running one after another.
+
+        Args:
+            type_names: WFS feature types to download
+            max_features: Limit number of features per type (default from settings)
+            target_crs: Target coordinate reference system (default: EPSG:4326)
+            max_workers: Number of concurrent requests (default from constructor)
+
+        Returns:
+            Dictionary mapping each feature type to its GeoDataFrame
+
+        Raises:
+            ValueError: If the WFS service returns an exception or invalid data
+            requests.RequestException: If all HTTP requests for a feature type fail
+        """
+        if self.logger:
+            self.logger.info(f"Requesting {len(type_names)} feature types concurrently")
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = {
+                type_name: executor.submit(
+                    self.download_to_geodataframe,
+                    type_name,
+                    max_features=max_features,
+                    target_crs=target_crs,
+                )
+                for type_name in type_names
+            }
+            return {type_name: future.result() for type_name, future in futures.items()}
+
+    def download_many_batched(
+        self,
+        type_names: list[str],
+        max_features: int | None = None,
+        target_crs: str | None = None,
+        batch_size: int = _MAX_BATCH_TYPE_NAMES,
+    ) -> dict[str, gpd.GeoDataFrame]:
+        """
+        Download several WFS feature types with one GetFeature request per batch.
+
+        WFS 2.0 accepts a comma-separated typeNames list, so up to batch_size
+        layers share a single round trip. The combined FeatureCollection is split
+        back into layers by the "<type>.<fid>" feature ids the server assigns.
+        Batches whose features cannot be attributed that way, or whose shared
+        feature limit may have truncated a layer, are downloaded per layer
+        instead. Batched layers carry the union of the batch's attribute columns.
+
+        Args:
+            type_names: WFS feature types to download
+            max_features: Limit number of features per type (default from settings)
+            target_crs: Target coordinate reference system (default: EPSG:4326)
+            batch_size: Maximum feature types per request (capped at 5)
+
+        Returns:
+            Dictionary mapping each feature type to its GeoDataFrame
+
+        Raises:
+            ValueError: If the WFS service returns an exception or invalid data
+            requests.RequestException: If all HTTP requests for a batch fail
+        """
+        batch_size = max(1, min(batch_size, _MAX_BATCH_TYPE_NAMES))
+        max_features = max_features or self.max_features
+        results = {}
+
+        for start in range(0, len(type_names), batch_size):
+            batch = type_names[start : start + batch_size]
+            if self.logger:
+                self.logger.info(f"Requesting feature types {batch} in one WFS request")
+
+            # The feature limit applies to the whole response, so scale it with the batch
+            url = self.build_wfs_url(
+                type_name=",".join(batch),
+                max_features=max_features * len(batch),
+                target_crs=target_crs or "EPSG:4326",
+            )
+            gdf = self._fetch_geodataframe(url)
+
+            layers = self._split_batched_layers(gdf, batch)
+            if layers is None:
+                if self.logger:
+                    self.logger.warning(
+                        "Batched response lacks per-layer feature ids, downloading per layer"
+                    )
+                results.update(self.download_many(batch, max_features, target_crs))
+                continue
+
+            # One layer can use up the shared limit and leave the others truncated or
+            # empty, so any sign of a hit limit is resolved with per-layer requests
+            if len(batch) > 1 and (
+                len(gdf) >= max_features * len(batch)
+                or any(len(layer) > max_features for layer in layers.values())
+            ):
+                if self.logger:
+                    self.logger.warning(
+                        "Batched response may be truncated by the feature limit, "
+                        "downloading per layer"
+                    )
+                results.update(self.download_many(batch, max_features, target_crs))
+                continue
+
+            for type_name, layer in layers.items():
+                if target_crs and layer.crs and not layer.empty and layer.crs != target_crs:
+                    layer = layer.to_crs(target_crs)
+                results[type_name] = layer
+
+        if self.logger:
+            self.logger.info(f"Successfully downloaded {len(results)} feature types")
+
+        return results
+
+    @staticmethod
+    def _split_batched_layers(
+        gdf: gpd.GeoDataFrame, type_names: list[str]
+    ) -> dict[str, gpd.GeoDataFrame] | None:
+        """Split a multi-type response by feature id prefix, or None if ids are missing."""
+        if len(type_names) == 1:
+            return {type_names[0]: gdf}
+        if "id" not in gdf.columns:
+            return None
+
+        # Feature ids look like "<local type name>.<fid>", without the namespace prefix
+        id_prefixes = gdf["id"].astype(str).str.rpartition(".")[0]
+        layers = {}
+        attributed = 0
+        for type_name in type_names:
+            mask = (id_prefixes == type_name.rpartition(":")[2]).to_numpy()
+            attributed += int(mask.sum())
+            # The response only has the union of the layer schemas, so all columns are
+            # kept; dropping all-missing ones would also drop a layer's sparse attributes
+            layers[type_name] = gdf[mask].reset_index(drop=True)
+
+        return layers if attributed == len(gdf) else None
+
 
 if __name__ == "__main__":
     # Example usage for testing
@@ -7,6 +7,7 @@ used in UHI analysis, including CORINE Land Cover data and weather station data.
 
 from heatsense.utils.data_processor import (
     UHI_CATEGORY_DESCRIPTIONS,
+    UHI_CATEGORY_DESCRIPTIONS_DE,
     UHI_IMPERVIOUSNESS_COEFFICIENTS,
     process_corine_for_uhi,
     standardize_weather_data,
@@ -16,5 +17,6 @@ __all__ = [
     "process_corine_for_uhi",
     "standardize_weather_data",
     "UHI_CATEGORY_DESCRIPTIONS",
+    "UHI_CATEGORY_DESCRIPTIONS_DE",
     "UHI_IMPERVIOUSNESS_COEFFICIENTS",
 ]
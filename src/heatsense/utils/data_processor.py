@@ -6,9 +6,12 @@ in the context of Urban Heat Island (UHI) research, including CORINE land cover
 transformation, weather station standardization, and imperviousness mapping.
 """
 
+import functools
 import logging
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -99,9 +102,94 @@ UHI_CATEGORY_DESCRIPTIONS = {
     "open_areas": "Natural Open Areas",
 }
 
+# German descriptions for the same UHI categories, used by the German-language reports
+UHI_CATEGORY_DESCRIPTIONS_DE = {
+    "dense_urban": "Dichte Bebauung",
+    "residential": "Wohngebiete",
+    "industrial": "Industrie und Gewerbe",
+    "transport": "Verkehrsflächen",
+    "urban_green": "Städtisches Grün",
+    "agriculture": "Landwirtschaft",
+    "forest": "Wald",
+    "natural": "Natürliche Vegetation",
+    "water": "Gewässer",
+    "open_areas": "Offene Flächen",
+}
+
+# Column names that may hold CORINE codes or station temperatures, in priority order
+_CORINE_CODE_COLUMNS = (
+    "Code_18",
+    "CODE_18",
+    "corine_code",
+    "Code_12",
+    "CODE_12",
+    "Code_06",
+    "CODE_06",
+    "CODE_00",
+    "CODE_90",
+    "gridcode",
+    "GRIDCODE",
+)
+_CORINE_CODE_COLUMN_SET = frozenset(_CORINE_CODE_COLUMNS)
+_TEMPERATURE_COLUMNS = (
+    "temperature",
+    "temp",
+    "ground_temp",
+    "air_temperature",
+    "mean_temp",
+    "avg_temp",
+    "value",
+    "measurement",
+)
+_TEMPERATURE_COLUMN_SET = frozenset(_TEMPERATURE_COLUMNS)
+
+# Dense lookup tables indexed by CORINE code; the last category slot holds the defaults
+# for unmapped codes ("unknown"), which is where every code outside the mapping points.
+# The tables are built on first use, so importing the package costs nothing extra.
+_MAX_CORINE_CODE = 600
+_UHI_CATEGORIES = (*UHI_IMPERVIOUSNESS_COEFFICIENTS, "unknown")
+_UNKNOWN_CATEGORY_ID = len(_UHI_CATEGORIES) - 1
+_DESCRIPTION_SOURCES = {
+    "en": (UHI_CATEGORY_DESCRIPTIONS, "Unknown Land Use"),
+    "de": (UHI_CATEGORY_DESCRIPTIONS_DE, "Unbekannte Landnutzung"),
+}
+
+
+@functools.cache
+def _category_id_lut() -> np.ndarray:
+    """Map every CORINE code below _MAX_CORINE_CODE to its UHI category id."""
+    lut = np.full(_MAX_CORINE_CODE, _UNKNOWN_CATEGORY_ID, dtype=np.int8)
+    for code, category in CORINE_TO_UHI_MAPPING.items():
+        lut[code] = _UHI_CATEGORIES.index(category)
+    return lut
+
+
+@functools.cache
+def _category_dtype() -> pd.CategoricalDtype:
+    """Categorical dtype whose codes are the UHI category ids."""
+    return pd.CategoricalDtype(_UHI_CATEGORIES)
+
+
+@functools.cache
+def _category_descriptions(language: str) -> tuple[str, ...]:
+    """Descriptions in category id order for the given language."""
+    descriptions, unknown_description = _DESCRIPTION_SOURCES[language]
+    return (*(descriptions[category] for category in _UHI_CATEGORIES[:-1]), unknown_description)
+
+
+@functools.cache
+def _imperviousness_lut() -> np.ndarray:
+    """Imperviousness coefficients in category id order."""
+    return np.array(
+        [UHI_IMPERVIOUSNESS_COEFFICIENTS[category] for category in _UHI_CATEGORIES[:-1]] + [0.5]
+    )
+
 
 def process_corine_for_uhi(
-    corine_gdf: gpd.GeoDataFrame, logger_instance: logging.Logger | None = None
+    corine_gdf: gpd.GeoDataFrame,
+    logger_instance: logging.Logger | None = None,
+    inplace: bool = False,
+    language: str = "en",
 ) -> gpd.GeoDataFrame:
     """
     Transform CORINE Land Cover data for Urban Heat Island analysis.
@@ -112,41 +200,36 @@ def process_corine_for_uhi(
     Args:
         corine_gdf: GeoDataFrame with CORINE land cover data
         logger_instance: Optional logger for processing information
+        inplace: Add the columns to corine_gdf itself instead of a shallow copy
+        language: Language of landuse_description, "en" or "de". Category ids
+            in landuse_category are always the English keys.
 
     Returns:
-        Enhanced GeoDataFrame with landuse_category, landuse_description,
-        and imperviousness_coefficient columns
+        Enhanced GeoDataFrame with categorical landuse_category and
+        landuse_description columns and an imperviousness_coefficient column
 
     Raises:
-        ValueError: If no valid CORINE code column is found
+        ValueError: If no valid CORINE code column is found or language is unsupported
     """
+    if language not in _DESCRIPTION_SOURCES:
+        raise ValueError(
+            f"Unsupported language '{language}'. Choose from {sorted(_DESCRIPTION_SOURCES)}"
+        )
+
     if logger_instance:
         logger_instance.info("Starting CORINE Land Cover processing for UHI analysis")
     else:
         logger.info("Starting CORINE Land Cover processing for UHI analysis")
 
-    processed_gdf = corine_gdf.copy()
+    # Only new columns are assigned, so a shallow copy leaves the input untouched
+    processed_gdf = corine_gdf if inplace else corine_gdf.copy(deep=False)
 
     # Search for CORINE code column - various naming conventions exist
-    possible_code_columns = [
-        "Code_18",
-        "CODE_18",
-        "corine_code",
-        "Code_12",
-        "CODE_12",
-        "Code_06",
-        "CODE_06",
-        "CODE_00",
-        "CODE_90",
-        "gridcode",
-        "GRIDCODE",
-    ]
-
-    code_column = None
-    for column_name in possible_code_columns:
-        if column_name in processed_gdf.columns:
-            code_column = column_name
-            break
+    present_columns = _CORINE_CODE_COLUMN_SET.intersection(processed_gdf.columns)
+    code_column = next(
+        (column_name for column_name in _CORINE_CODE_COLUMNS if column_name in present_columns),
+        None,
+    )
 
     if code_column is None:
         available_columns = list(processed_gdf.columns)
@@ -157,25 +240,26 @@ def process_corine_for_uhi(
             logger.error(error_msg)
         raise ValueError(error_msg)
 
-    # Standardize code column and apply UHI mapping
-    processed_gdf["corine_code"] = processed_gdf[code_column].astype(int)
-    processed_gdf["landuse_category"] = processed_gdf["corine_code"].map(CORINE_TO_UHI_MAPPING)
-    processed_gdf["landuse_description"] = processed_gdf["landuse_category"].map(
-        UHI_CATEGORY_DESCRIPTIONS
-    )
-    processed_gdf["imperviousness_coefficient"] = processed_gdf["landuse_category"].map(
-        UHI_IMPERVIOUSNESS_COEFFICIENTS
+    # Standardize code column and apply UHI mapping through the dense lookup tables
+    codes = processed_gdf[code_column].to_numpy(dtype=np.int64)
+    category_ids = np.full(len(codes), _UNKNOWN_CATEGORY_ID, dtype=np.int8)
+    in_range = (codes >= 0) & (codes < _MAX_CORINE_CODE)
+    category_ids[in_range] = _category_id_lut()[codes[in_range]]
+
+    # Category and description share the int8 codes; only the labels differ
+    landuse_category = pd.Categorical.from_codes(category_ids, dtype=_category_dtype())
+
+    processed_gdf["corine_code"] = codes
+    processed_gdf["landuse_category"] = landuse_category
+    processed_gdf["landuse_description"] = landuse_category.rename_categories(
+        _category_descriptions(language)
     )
+    processed_gdf["imperviousness_coefficient"] = _imperviousness_lut()[category_ids]
 
-    # Handle unmapped CORINE codes
-    unmapped_mask = processed_gdf["landuse_category"].isna()
+    # Unmapped CORINE codes already carry the default values of the "unknown" slot
+    unmapped_mask = category_ids == _UNKNOWN_CATEGORY_ID
     if unmapped_mask.any():
-        unmapped_codes = processed_gdf.loc[unmapped_mask, "corine_code"].unique()
-
-        # Assign default values for unmapped codes
-        processed_gdf.loc[unmapped_mask, "landuse_category"] = "unknown"
-        processed_gdf.loc[unmapped_mask, "landuse_description"] = "Unknown Land Use"
-        processed_gdf.loc[unmapped_mask, "imperviousness_coefficient"] = 0.5
+        unmapped_codes = np.unique(codes[unmapped_mask])
 
         warning_msg = f"Unmapped CORINE codes found: {unmapped_codes}. Assigned default values."
         if logger_instance:
@@ -185,7 +269,7 @@ def process_corine_for_uhi(
 
     # Log processing summary
     total_features = len(processed_gdf)
-    category_count = len(processed_gdf["landuse_category"].value_counts())
+    category_count = len(np.unique(category_ids))
     summary_msg = f"Processed {total_features} features into {category_count} UHI categories"
 
     if logger_instance:
@@ -197,7 +281,9 @@ def process_corine_for_uhi(
 
 
 def standardize_weather_data(
-    weather_gdf: gpd.GeoDataFrame, logger_instance: logging.Logger | None = None
+    weather_gdf: gpd.GeoDataFrame,
+    logger_instance: logging.Logger | None = None,
+    inplace: bool = False,
 ) -> gpd.GeoDataFrame:
     """Standardize weather station data with consistent temperature column naming."""
     if logger_instance:
@@ -205,29 +291,19 @@ def standardize_weather_data(
     else:
         logger.info("Standardizing weather station data for UHI analysis")
 
-    standardized_gdf = weather_gdf.copy()
+    # Only a new column is assigned, so a shallow copy leaves the input untouched
+    standardized_gdf = weather_gdf if inplace else weather_gdf.copy(deep=False)
 
     # Search for temperature column - various naming conventions
-    possible_temperature_columns = [
-        "temperature",
-        "temp",
-        "ground_temp",
-        "air_temperature",
-        "mean_temp",
-        "avg_temp",
-        "value",
-        "measurement",
-    ]
-
     if "temperature" not in standardized_gdf.columns:
-        temperature_column = None
-        for column_name in possible_temperature_columns:
-            if column_name in standardized_gdf.columns:
-                temperature_column = column_name
-                break
+        present_columns = _TEMPERATURE_COLUMN_SET.intersection(standardized_gdf.columns)
+        temperature_column = next(
+            (column_name for column_name in _TEMPERATURE_COLUMNS if column_name in present_columns),
+            None,
+        )
 
         if temperature_column:
-            standardized_gdf["temperature"] = standardized_gdf[temperature_column]
+            standardized_gdf["temperature"] = standardized_gdf[temperature_column].copy()
             info_msg = f"Using '{temperature_column}' as standardized temperature column"
             if logger_instance:
                 logger_instance.info(info_msg)
@@ -7,20 +7,31 @@ structured JSON output, comprehensive error handling, and multiple performance
 modes for different analysis requirements.
 """
 
+import hashlib
 import json
 import logging
+import os
+import re
+import tempfile
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import requests
+import shapely
 
 from heatsense.config.settings import (
     BERLIN_WFS_ENDPOINTS,
     BERLIN_WFS_FEATURE_TYPES,
     CRS_CONFIG,
+    UHI_CACHE_DIR,
     UHI_PERFORMANCE_MODES,
 )
 from heatsense.data.corine_downloader import CorineDataDownloader
@@ -29,6 +40,184 @@ from heatsense.data.urban_heat_island_analyzer import UrbanHeatIslandAnalyzer
 from heatsense.data.wfs_downloader import WFSDataDownloader
 from heatsense.utils.data_processor import process_corine_for_uhi
 
+# Percentiles reported in the temperature summary
+_SUMMARY_PERCENTILES = np.array([0.25, 0.50, 0.75, 0.90])
+
+# Boundary and CORINE polygons change rarely, so filtered downloads are reused for 30 days
+_AREA_CACHE_TTL = 30 * 24 * 3600
+
+# Offset from midnight to the end of a day, matching datetime.max.time()
+_LAST_MICROSECOND_OF_DAY = pd.Timedelta(days=1, microseconds=-1)
+
+# Column holding the area name in each Berlin boundary layer
+_BOUNDARY_NAME_COLUMNS = {
+    "state_boundary": "namlan",
+    "district_boundary": "namgem",
+    "locality_boundary": "nam",
+}
+
+# Land cover layers from this size on are clipped in spatially coherent partitions
+_OVERLAY_PARTITION_MIN_FEATURES = 20_000
+
+# CRS authorities that can be named in a GeoJSON "crs" member as an OGC URN
+_GEOJSON_CRS_AUTHORITIES = frozenset({"EDCS", "EPSG", "OGC", "SI", "UCUM"})
+
+# Exact types that are already valid JSON values; float is excluded because of NaN
+_JSON_NATIVE_TYPES = frozenset({str, bool, int})
+
+# Placeholder emitted for RawJSON values; json.dumps escapes the NUL bytes as \u0000
+_RAW_JSON_PLACEHOLDER = re.compile(r'"\\u0000raw(\d+)\\u0000"')
+
+
+class RawJSON:
+    """
+    Pre-encoded JSON text embedded in an analysis result.
+
+    GeoJSON payloads stay in the form GeoDataFrame.to_json produced, and
+    dumps_analysis_result splices them verbatim into the serialized result
+    instead of parsing and re-encoding them.
+
+    Args:
+        value: Valid JSON document
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def loads(self) -> Any:
+        """Parse the embedded JSON document into Python objects."""
+        return json.loads(self.value)
+
+
+def dumps_analysis_result(result: Any, **kwargs: Any) -> str:
+    """
+    Serialize an analysis result to JSON, splicing RawJSON fragments in verbatim.
+
+    Args:
+        result: Result returned by UHIAnalysisBackend.analyze
+        **kwargs: Additional keyword arguments for json.dumps (e.g. indent)
+
+    Returns:
+        JSON document as a string
+    """
+    fragments = []
+    text = json.dumps(result, default=_raw_json_default(fragments), **kwargs)
+    if not fragments:
+        return text
+    return _RAW_JSON_PLACEHOLDER.sub(lambda match: fragments[int(match.group(1))], text)
+
+
+def iter_analysis_result(result: Any, **kwargs: Any) -> Iterator[str]:
+    """
+    Serialize an analysis result to JSON in chunks, for streamed responses.
+
+    Produces the same document as dumps_analysis_result, but RawJSON fragments
+    are yielded as they are instead of being copied into one joined string.
+
+    Args:
+        result: Result returned by UHIAnalysisBackend.analyze
+        **kwargs: Additional keyword arguments for json.JSONEncoder (e.g. indent)
+
+    Yields:
+        Consecutive pieces of the JSON document
+    """
+    fragments = []
+    encoder = json.JSONEncoder(default=_raw_json_default(fragments), **kwargs)
+    buffer = []
+    for chunk in encoder.iterencode(result):
+        # split() alternates between plain text and captured fragment indices
+        parts = _RAW_JSON_PLACEHOLDER.split(chunk)
+        buffer.append(parts[0])
+        for index, text in zip(parts[1::2], parts[2::2], strict=True):
+            yield "".join(buffer)
+            yield fragments[int(index)]
+            buffer = [text]
+    yield "".join(buffer)
+
+
+def _raw_json_default(fragments: list[str]) -> Callable[[Any], str]:
+    """Build a json default hook that swaps RawJSON values for indexed placeholders."""
+
+    def encode_raw(obj: Any) -> str:
+        if isinstance(obj, RawJSON):
+            fragments.append(obj.value)
+            return f"\x00raw{len(fragments) - 1}\x00"
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    return encode_raw
+
+
+def _convert_json_scalar(obj: Any) -> Any:
+    """Convert a single NumPy/Pandas scalar to its JSON-serializable Python value."""
+    # float covers np.float64 too, and NaN is reported as missing
+    if isinstance(obj, float):
+        return None if obj != obj else float(obj)
+    # Pre-encoded GeoJSON payloads are serialized verbatim by dumps_analysis_result
+    elif isinstance(obj, (str, RawJSON)):
+        return obj
+    # Handle numpy scalar types (NumPy 2.0 compatible)
+    elif isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        return None if np.isnan(obj) else float(obj)
+    elif isinstance(obj, np.bool_):
+        return bool(obj)
+    elif isinstance(obj, (bool, int)):
+        return obj
+    elif pd.api.types.is_scalar(obj) and pd.isna(obj):
+        return None
+    else:
+        return obj
+
+
+def _to_geojson(gdf: gpd.GeoDataFrame) -> RawJSON:
+    """
+    Serialize a GeoDataFrame to a GeoJSON FeatureCollection.
+
+    Produces the same document as GeoDataFrame.to_json, but geometries are encoded
+    by GEOS through the vectorized shapely.to_geojson and attributes by the pandas
+    C JSON writer, so Python only joins the pre-encoded pieces per feature.
+    """
+    if len(gdf) == 0:
+        features = ""
+    else:
+        geometries = shapely.to_geojson(gdf.geometry.values)
+        attributes = gdf.drop(columns=gdf.geometry.name)
+        if attributes.columns.empty:
+            properties = ["{}"] * len(gdf)
+        else:
+            properties = (
+                attributes.to_json(
+                    orient="records", lines=True, date_format="iso", double_precision=15
+                )
+                .rstrip("\n")
+                .split("\n")
+            )
+        features = ",".join(
+            f'{{"id":{json.dumps(str(feature_id))},"type":"Feature",'
+            f'"properties":{feature_properties},"geometry":{geometry or "null"}}}'
+            for feature_id, feature_properties, geometry in zip(
+                gdf.index, properties, geometries, strict=True
+            )
+        )
+
+    # Like GeoDataFrame.to_json, name the CRS unless it is the GeoJSON default WGS84
+    crs_member = ""
+    if gdf.crs is not None and not gdf.crs.equals("EPSG:4326"):
+        authority = gdf.crs.to_authority()
+        if authority is not None and authority[0] in _GEOJSON_CRS_AUTHORITIES:
+            crs_name = f"urn:ogc:def:crs:{authority[0]}::{authority[1]}"
+            crs_member = f',"crs":{{"type":"name","properties":{{"name":"{crs_name}"}}}}'
+
+    return RawJSON(f'{{"type":"FeatureCollection","features":[{features}]{crs_member}}}')
+
+
+def _day_bounds(start_date: date, end_date: date) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Return the first and last microsecond of an inclusive date range."""
+    return pd.Timestamp(start_date), pd.Timestamp(end_date) + _LAST_MICROSECOND_OF_DAY
+
 
 class UHIAnalysisBackend:
     """
@@ -45,6 +234,17 @@ class UHIAnalysisBackend:
     def __init__(self, log_level: str = "INFO"):
         self.logger = self._setup_logging(log_level)
         self.performance_modes = UHI_PERFORMANCE_MODES
+        self._boundary_cache: dict[tuple[str, str], gpd.GeoDataFrame] = {}
+        # Full boundary layers per boundary type with their lower-cased names and a
+        # name -> first row position index, so other areas of a layer need no download
+        self._boundary_layers: dict[str, tuple[gpd.GeoDataFrame, np.ndarray, dict[str, int]]] = {}
+
+        # Downloaders and their pooled HTTP connections are shared by all analyses;
+        # the lock only guards their lazy creation
+        self._downloader_lock = threading.Lock()
+        self._wfs_downloaders: dict[str, WFSDataDownloader] = {}
+        self._dwd_downloader: DWDDataDownloader | None = None
+        self._corine_session = requests.Session()
 
         self.logger.info("UHI Analysis Backend initialized")
 
@@ -61,23 +261,62 @@ class UHIAnalysisBackend:
 
         return logger
 
+    def close(self) -> None:
+        """Close the shared HTTP sessions of all downloaders."""
+        with self._downloader_lock:
+            for wfs_downloader in self._wfs_downloaders.values():
+                wfs_downloader.close()
+            self._wfs_downloaders.clear()
+            self._corine_session.close()
+
+    def _get_wfs_downloader(self, endpoint_url: str) -> WFSDataDownloader:
+        """Return the shared WFS downloader for an endpoint, creating it on first use."""
+        with self._downloader_lock:
+            wfs_downloader = self._wfs_downloaders.get(endpoint_url)
+            if wfs_downloader is None:
+                wfs_downloader = WFSDataDownloader(
+                    endpoint_url=endpoint_url, verbose=False, cache_dir=UHI_CACHE_DIR / "wfs"
+                )
+                self._wfs_downloaders[endpoint_url] = wfs_downloader
+            return wfs_downloader
+
+    def _get_dwd_downloader(self) -> DWDDataDownloader:
+        """Return the shared DWD downloader, creating it on first use."""
+        with self._downloader_lock:
+            if self._dwd_downloader is None:
+                self._dwd_downloader = DWDDataDownloader(
+                    verbose=False, interpolate_by_default=True, cache_dir=UHI_CACHE_DIR / "dwd"
+                )
+            return self._dwd_downloader
+
     def _convert_to_json_serializable(self, obj: Any) -> Any:
         """Convert NumPy/Pandas types to JSON-serializable Python types."""
-        # Handle numpy numeric types (NumPy 2.0 compatible)
-        if isinstance(obj, (np.integer, np.int8, np.int16, np.int32, np.int64)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float16, np.float32, np.float64)):
-            return float(obj)
-        elif isinstance(obj, (np.ndarray, pd.Series)):
-            return obj.tolist()
-        elif isinstance(obj, dict):
-            return {key: self._convert_to_json_serializable(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_to_json_serializable(item) for item in obj]
-        elif pd.isna(obj):
-            return None
-        else:
-            return obj
+        # Containers are rebuilt from an explicit stack of (target, source items) pairs
+        # instead of recursing, so nested values cost no Python call frame each
+        root = [None]
+        stack = [(root, enumerate([obj]))]
+        while stack:
+            target, items = stack.pop()
+            for key, value in items:
+                # Plain JSON scalars make up most leaves and need no conversion
+                if value is None or type(value) in _JSON_NATIVE_TYPES:
+                    target[key] = value
+                    continue
+                if type(value) is float:
+                    target[key] = None if value != value else value
+                    continue
+                # Arrays are converted as lists so that NaN elements become None as well
+                if isinstance(value, (np.ndarray, pd.Series)):
+                    value = value.tolist()
+                if isinstance(value, dict):
+                    target[key] = converted = {}
+                    stack.append((converted, value.items()))
+                elif isinstance(value, list):
+                    target[key] = converted = [None] * len(value)
+                    stack.append((converted, enumerate(value)))
+                else:
+                    target[key] = _convert_json_scalar(value)
+        return root[0]
 
     def analyze(
         self, area: str, start_date: str, end_date: str, performance_mode: str = "standard"
@@ -100,7 +339,8 @@ class UHIAnalysisBackend:
             - status: Analysis completion status (completed/error/in_progress)
             - progress: Completion percentage (0-100)
             - metadata: Analysis configuration and performance metrics
-            - data: Structured analysis results (temperature, hotspots, correlations, etc.)
+            - data: Structured analysis results (temperature, hotspots, correlations, etc.);
+              GeoJSON layers are RawJSON fragments, serialize with dumps_analysis_result
             - errors: List of error messages if analysis failed
             - warnings: List of warning messages
             - execution_time: Total analysis duration in seconds
@@ -165,12 +405,31 @@ class UHIAnalysisBackend:
                 result["execution_time"] = time.time() - start_time
                 return self._convert_to_json_serializable(result)
 
-            # Step 3: Download CORINE Land Cover data
-            self.logger.info("🌱 Step 3/6: Acquiring land cover data...")
-            landcover_data = self._download_landcover_data(
-                boundary_data, start_date_parsed, end_date_parsed
-            )
-            result["progress"] = 40
+            # Steps 3 and 4 only depend on the boundary, so the network-bound land cover
+            # and weather downloads run concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Step 3: Download CORINE Land Cover data
+                self.logger.info("🌱 Step 3/6: Acquiring land cover data...")
+                landcover_future = executor.submit(
+                    self._download_landcover_data, boundary_data, start_date_parsed, end_date_parsed
+                )
+
+                # Step 4: Download weather data (optional based on performance mode)
+                weather_future = None
+                if include_weather:
+                    self.logger.info("🌤️ Step 4/6: Acquiring weather station data...")
+                    weather_future = executor.submit(
+                        self._download_weather_data,
+                        boundary_data,
+                        start_date_parsed,
+                        end_date_parsed,
+                    )
+
+                landcover_data = landcover_future.result()
+                result["progress"] = 40
+                weather_stations, weather_stations_interpolated = (
+                    weather_future.result() if weather_future is not None else (None, None)
+                )
 
             if landcover_data is None or landcover_data.empty:
                 result["status"] = "error"
@@ -180,18 +439,10 @@ class UHIAnalysisBackend:
                 result["execution_time"] = time.time() - start_time
                 return self._convert_to_json_serializable(result)
 
-            # Step 4: Download weather data (optional based on performance mode)
-            weather_stations = None
-            weather_stations_interpolated = None
-            if include_weather:
-                self.logger.info("🌤️ Step 4/6: Acquiring weather station data...")
-                weather_stations, weather_stations_interpolated = self._download_weather_data(
-                    boundary_data, start_date_parsed, end_date_parsed
+            if include_weather and weather_stations is None:
+                result["warnings"].append(
+                    "Weather station data unavailable, continuing without ground validation"
                 )
-                if weather_stations is None:
-                    result["warnings"].append(
-                        "Weather station data unavailable, continuing without ground validation"
-                    )
 
             # Step 5: Configure analysis engine
             self.logger.info("⚙️ Step 5/6: Configuring analysis engine...")
@@ -263,47 +514,85 @@ class UHIAnalysisBackend:
         else:
             return "locality_boundary"
 
-    def _download_boundary_data(self, area: str) -> gpd.GeoDataFrame | None:
-        """Download geographical boundary data for the specified area."""
-        try:
-            boundary_type = self._get_boundary_type(area)
+    def _get_area_cache_path(self, kind: str, *key_parts: Any) -> Path:
+        """Build a content-addressed GeoParquet cache path for a filtered download."""
+        digest = hashlib.blake2b(repr(key_parts).encode(), digest_size=16).hexdigest()
+        return UHI_CACHE_DIR / kind / f"{digest}.parquet"
 
-            endpoint_url = BERLIN_WFS_ENDPOINTS[boundary_type]
-            feature_type = BERLIN_WFS_FEATURE_TYPES[boundary_type]
-            target_crs = CRS_CONFIG["OUTPUT"]
-
-            wfs_downloader = WFSDataDownloader(endpoint_url=endpoint_url, verbose=False)
-
-            boundaries_gdf = wfs_downloader.download_to_geodataframe(
-                type_name=feature_type, target_crs=target_crs
-            )
+    def _read_area_cache(
+        self, cache_path: Path, bbox: tuple[float, float, float, float] | None = None
+    ) -> gpd.GeoDataFrame | None:
+        """
+        Load a cached GeoDataFrame if it exists and is younger than the cache TTL.
 
-            if boundaries_gdf.empty:
-                self.logger.error(f"No {boundary_type} data available")
+        With ``bbox`` given, only row groups and rows whose covering bounding box
+        intersects it are read from disk.
+        """
+        try:
+            if time.time() - cache_path.stat().st_mtime >= _AREA_CACHE_TTL:
                 return None
+            gdf = gpd.read_parquet(cache_path, bbox=bbox)
+        except Exception:
+            return None
 
-            # Determine appropriate name column based on boundary type
-            name_column_mapping = {
-                "state_boundary": "namlan",
-                "district_boundary": "namgem",
-                "locality_boundary": "nam",
-            }
+        self.logger.info(f"Loaded cached data from {cache_path}")
+        return gdf
+
+    def _write_area_cache(self, cache_path: Path, gdf: gpd.GeoDataFrame) -> None:
+        """Atomically store a GeoDataFrame as GeoParquet; failures only cost the cache."""
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temporary file per writer, since concurrent analyses of the same
+            # area may cache the same data at the same time
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = Path(f.name)
+            # zstd keeps the files small; the bbox covering column lets readers skip
+            # row groups outside their area of interest
+            gdf.to_parquet(tmp_path, compression="zstd", write_covering_bbox=True)
+            tmp_path.replace(cache_path)
+        except Exception as e:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            self.logger.warning(f"Could not cache data at {cache_path}: {e}")
 
-            name_column = name_column_mapping.get(boundary_type)
+    def _download_boundary_data(self, area: str) -> gpd.GeoDataFrame | None:
+        """Download geographical boundary data for the specified area."""
+        try:
+            boundary_type = self._get_boundary_type(area)
 
-            if not name_column or name_column not in boundaries_gdf.columns:
-                self.logger.error(
-                    f"Expected name column '{name_column}' not found in {boundary_type}"
-                )
+            # Repeat requests for an area are served from memory, then from disk
+            cache_key = (boundary_type, area.lower())
+            area_gdf = self._boundary_cache.get(cache_key)
+            cache_path = self._get_area_cache_path("boundaries", *cache_key)
+            if area_gdf is None:
+                area_gdf = self._read_area_cache(cache_path)
+            if area_gdf is not None:
+                self._boundary_cache[cache_key] = area_gdf
+                return area_gdf.copy()
+
+            layer = self._get_boundary_layer(boundary_type)
+            if layer is None:
                 return None
-
-            # Filter for the specific area (case-insensitive)
-            area_mask = boundaries_gdf[name_column].str.contains(area, case=False, na=False)
-            area_gdf = boundaries_gdf[area_mask]
+            boundaries_gdf, names, name_index = layer
+            name_column = _BOUNDARY_NAME_COLUMNS[boundary_type]
+
+            # Filter for the specific area (case-insensitive); an exact name match wins
+            # over substring matches such as "Charlottenburg" in "Charlottenburg-Nord"
+            position = name_index.get(area.lower())
+            if position is not None:
+                area_gdf = boundaries_gdf.iloc[[position]]
+            else:
+                area_gdf = boundaries_gdf[np.char.find(names, area.lower()) >= 0]
 
             if len(area_gdf) == 0:
-                available_areas = boundaries_gdf[name_column].tolist()
-                self.logger.error(f"Area '{area}' not found. Available areas: {available_areas}")
+                self.logger.error(
+                    f"Area '{area}' not found among {len(boundaries_gdf)} {boundary_type} areas"
+                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Available areas: {boundaries_gdf[name_column].tolist()}")
                 return None
 
             if len(area_gdf) > 1:
@@ -312,25 +601,80 @@ class UHIAnalysisBackend:
                 area_gdf = area_gdf.iloc[[0]]
 
             self.logger.info(f"Successfully acquired boundary data for '{area}'")
-            return area_gdf
+            self._boundary_cache[cache_key] = area_gdf
+            self._write_area_cache(cache_path, area_gdf)
+            return area_gdf.copy()
 
         except Exception as e:
             self.logger.error(f"Boundary data acquisition failed: {e}")
             return None
 
+    def _get_boundary_layer(
+        self, boundary_type: str
+    ) -> tuple[gpd.GeoDataFrame, np.ndarray, dict[str, int]] | None:
+        """Return a boundary layer with its name lookup, downloading it on first use."""
+        layer = self._boundary_layers.get(boundary_type)
+        if layer is not None:
+            return layer
+
+        endpoint_url = BERLIN_WFS_ENDPOINTS[boundary_type]
+        feature_type = BERLIN_WFS_FEATURE_TYPES[boundary_type]
+        target_crs = CRS_CONFIG["OUTPUT"]
+
+        boundaries_gdf = self._get_wfs_downloader(endpoint_url).download_to_geodataframe(
+            type_name=feature_type, target_crs=target_crs
+        )
+
+        if boundaries_gdf.empty:
+            self.logger.error(f"No {boundary_type} data available")
+            return None
+
+        name_column = _BOUNDARY_NAME_COLUMNS[boundary_type]
+        if name_column not in boundaries_gdf.columns:
+            self.logger.error(f"Expected name column '{name_column}' not found in {boundary_type}")
+            return None
+
+        names = np.char.lower(boundaries_gdf[name_column].fillna("").to_numpy(dtype=str))
+        name_index: dict[str, int] = {}
+        for position, name in enumerate(names.tolist()):
+            name_index.setdefault(name, position)
+
+        layer = (boundaries_gdf, names, name_index)
+        self._boundary_layers[boundary_type] = layer
+        return layer
+
     def _download_landcover_data(
         self, boundary_data: gpd.GeoDataFrame, start_date: date, end_date: date
     ) -> gpd.GeoDataFrame | None:
         """Download CORINE Land Cover data for the boundary area."""
         try:
             # Convert dates for CORINE downloader compatibility
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
+            start_datetime, end_datetime = _day_bounds(start_date, end_date)
 
             corine_downloader = CorineDataDownloader(
-                year_or_period=(start_datetime, end_datetime), verbose=False
+                year_or_period=(start_datetime, end_datetime),
+                verbose=False,
+                session=self._corine_session,
             )
 
+            # CORINE releases are static, so the boundary shape and dataset year identify
+            # the download completely
+            boundary_digest = hashlib.blake2b(
+                b"".join(boundary_data.geometry.to_wkb()), digest_size=16
+            ).hexdigest()
+            cache_path = self._get_area_cache_path(
+                "landcover",
+                boundary_digest,
+                boundary_data.crs.to_epsg() if boundary_data.crs else None,
+                corine_downloader.selected_year,
+                CRS_CONFIG["OUTPUT"],
+            )
+            landcover_gdf = self._read_area_cache(
+                cache_path, bbox=tuple(boundary_data.to_crs(CRS_CONFIG["OUTPUT"]).total_bounds)
+            )
+            if landcover_gdf is not None:
+                return landcover_gdf
+
             landcover_gdf = corine_downloader.download_for_area(
                 boundary_data, target_crs=CRS_CONFIG["OUTPUT"]
             )
@@ -340,6 +684,7 @@ class UHIAnalysisBackend:
                 return None
 
             self.logger.info(f"Successfully acquired {len(landcover_gdf)} land cover features")
+            self._write_area_cache(cache_path, landcover_gdf)
             return landcover_gdf
 
         except Exception as e:
@@ -351,12 +696,9 @@ class UHIAnalysisBackend:
     ) -> tuple:
         """Download weather station data for ground validation."""
         try:
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-
-            dwd_downloader = DWDDataDownloader(verbose=False, interpolate_by_default=True)
+            start_datetime, end_datetime = _day_bounds(start_date, end_date)
 
-            weather_result = dwd_downloader.download_for_area(
+            weather_result = self._get_dwd_downloader().download_for_area(
                 geometry=boundary_data, start_date=start_datetime, end_date=end_datetime
             )
 
@@ -447,27 +789,49 @@ class UHIAnalysisBackend:
         if temp_stats is None or "temperature" not in temp_stats.columns:
             return
 
-        valid_temps = temp_stats["temperature"].dropna()
+        # Land surface temperatures carry ~0.1 °C precision, so the summary passes run on
+        # float32 to halve the bytes they stream; reductions still accumulate in float64
+        temperatures = temp_stats["temperature"].to_numpy(dtype=np.float32)
+        valid_temps = temperatures[~np.isnan(temperatures)]
 
-        if len(valid_temps) == 0:
+        if valid_temps.size == 0:
             return
 
+        # Linearly interpolated percentiles, min and max from a single partial sort
+        # instead of a full one; rank 0 and n - 1 are the extremes
+        positions = _SUMMARY_PERCENTILES * (valid_temps.size - 1)
+        lower = positions.astype(np.intp)
+        upper = np.minimum(lower + 1, valid_temps.size - 1)
+        partitioned = np.partition(
+            valid_temps, np.unique(np.concatenate(([0, valid_temps.size - 1], lower, upper)))
+        )
+        percentiles = partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (
+            positions - lower
+        )
+
+        # Moments and order statistics are rounded together into plain floats
+        std = valid_temps.std(ddof=1, dtype=np.float64) if valid_temps.size > 1 else np.nan
+        mean, std, min_temp, max_temp, p25, p50, p75, p90 = np.round(
+            np.concatenate(
+                (
+                    [valid_temps.mean(dtype=np.float64), std, partitioned[0], partitioned[-1]],
+                    percentiles,
+                )
+            ),
+            2,
+        ).tolist()
+
         processed["temperature_data"] = {
             "grid_cells_total": len(temp_stats),
-            "grid_cells_valid": len(valid_temps),
+            "grid_cells_valid": int(valid_temps.size),
             "statistics": {
-                "mean": round(valid_temps.mean(), 2),
-                "std": round(valid_temps.std(), 2),
-                "min": round(valid_temps.min(), 2),
-                "max": round(valid_temps.max(), 2),
-                "percentiles": {
-                    "p25": round(valid_temps.quantile(0.25), 2),
-                    "p50": round(valid_temps.quantile(0.50), 2),
-                    "p75": round(valid_temps.quantile(0.75), 2),
-                    "p90": round(valid_temps.quantile(0.90), 2),
-                },
+                "mean": mean,
+                "std": std,
+                "min": min_temp,
+                "max": max_temp,
+                "percentiles": {"p25": p25, "p50": p50, "p75": p75, "p90": p90},
             },
-            "geojson": json.loads(temp_stats.to_json()),
+            "geojson": _to_geojson(temp_stats),
         }
 
     def _process_hotspots_data(
@@ -483,15 +847,16 @@ class UHIAnalysisBackend:
 
         temp_data = {}
         if "temperature" in hotspots.columns:
+            # Reductions return NumPy scalars; cast once so the leaves are plain floats
             temp_data = {
-                "min": round(hotspots["temperature"].min(), 2),
-                "max": round(hotspots["temperature"].max(), 2),
+                "min": round(float(hotspots["temperature"].min()), 2),
+                "max": round(float(hotspots["temperature"].max()), 2),
             }
 
         processed["hotspots"] = {
             "count": len(hotspots),
             "temperature_range": temp_data,
-            "geojson": json.loads(hotspots.to_json()),
+            "geojson": _to_geojson(hotspots),
         }
 
     def _process_landuse_correlation(
@@ -528,6 +893,18 @@ class UHIAnalysisBackend:
             return
 
         try:
+            # The range only needs the temperature column, so it is reduced on its own
+            # array before the frame is copied for serialization
+            temp_range = {}
+            if "ground_temp" in weather_data.columns:
+                temps = weather_data["ground_temp"].to_numpy(dtype=np.float32)
+                temps = temps[~np.isnan(temps)]
+                if temps.size:
+                    temp_range = {
+                        "min": round(float(temps.min()), 2),
+                        "max": round(float(temps.max()), 2),
+                    }
+
             weather_copy = weather_data.copy()
 
             # Convert datetime columns for JSON serialization
@@ -537,17 +914,10 @@ class UHIAnalysisBackend:
                 elif str(weather_copy[col].dtype).startswith("datetime"):
                     weather_copy[col] = weather_copy[col].astype(str)
 
-            temp_range = {}
-            if "ground_temp" in weather_copy.columns:
-                temp_range = {
-                    "min": round(weather_copy["ground_temp"].min(), 2),
-                    "max": round(weather_copy["ground_temp"].max(), 2),
-                }
-
             processed["weather_stations"] = {
                 "count": len(weather_copy),
                 "temperature_range": temp_range,
-                "geojson": json.loads(weather_copy.to_json()),
+                "geojson": _to_geojson(weather_copy),
             }
 
         except Exception as e:
@@ -584,7 +954,7 @@ class UHIAnalysisBackend:
             return
 
         try:
-            processed["boundary"] = json.loads(boundary_data.to_json())
+            processed["boundary"] = _to_geojson(boundary_data)
         except Exception as e:
             self.logger.warning(f"Boundary data processing failed: {e}")
 
@@ -603,7 +973,7 @@ class UHIAnalysisBackend:
 
             # Clip to boundary area if available
             if boundary_data is not None and not boundary_data.empty:
-                landcover_copy = gpd.overlay(landcover_copy, boundary_data, how="intersection")
+                landcover_copy = self._overlay_with_boundary(landcover_copy, boundary_data)
 
             if landcover_copy.empty:
                 return
@@ -611,11 +981,47 @@ class UHIAnalysisBackend:
             # Process using standardized CORINE classification
             landcover_copy = self._standardize_landcover_data(landcover_copy)
 
-            processed["landuse_data"] = {"geojson": json.loads(landcover_copy.to_json())}
+            processed["landuse_data"] = {"geojson": _to_geojson(landcover_copy)}
 
         except Exception as e:
             self.logger.warning(f"Land cover data processing failed: {e}")
 
+    def _overlay_with_boundary(
+        self, landcover_data: gpd.GeoDataFrame, boundary_data: gpd.GeoDataFrame
+    ) -> gpd.GeoDataFrame:
+        """
+        Intersect land cover polygons with the boundary, in parallel for large layers.
+
+        Large layers are ordered along a Hilbert curve and split into one partition
+        per CPU. Partitions whose bounds miss the boundary are skipped, and the rest
+        are overlaid concurrently since shapely releases the GIL.
+        """
+        if len(landcover_data) < _OVERLAY_PARTITION_MIN_FEATURES:
+            return gpd.overlay(landcover_data, boundary_data, how="intersection")
+
+        order = np.argsort(landcover_data.geometry.hilbert_distance(), kind="stable")
+        partitions = [
+            landcover_data.iloc[positions]
+            for positions in np.array_split(order, os.cpu_count() or 1)
+        ]
+        boundary_box = shapely.box(*boundary_data.total_bounds)
+        partitions = [
+            partition
+            for partition in partitions
+            if shapely.intersects(shapely.box(*partition.total_bounds), boundary_box)
+        ]
+        if not partitions:
+            return gpd.overlay(landcover_data.iloc[:0], boundary_data, how="intersection")
+
+        with ThreadPoolExecutor(max_workers=len(partitions)) as executor:
+            clipped = list(
+                executor.map(
+                    lambda partition: gpd.overlay(partition, boundary_data, how="intersection"),
+                    partitions,
+                )
+            )
+        return pd.concat(clipped, ignore_index=True)
+
     def _standardize_landcover_data(self, landcover_data: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
         """Standardize land cover data using CORINE classification system."""
         # Find CORINE code column
@@ -644,13 +1050,16 @@ class UHIAnalysisBackend:
 
             try:
                 # Process using unified classification system
-                landcover_data = process_corine_for_uhi(landcover_data, logger=self.logger)
+                landcover_data = process_corine_for_uhi(
+                    landcover_data, logger_instance=self.logger, inplace=True, language="de"
+                )
 
                 # Ensure frontend compatibility
-                if "impervious_area" in landcover_data.columns:
-                    landcover_data["impervious_coefficient"] = landcover_data["impervious_area"]
-                if "landuse_type" in landcover_data.columns:
-                    landcover_data["land_use_type"] = landcover_data["landuse_type"]
+                landcover_data["impervious_coefficient"] = landcover_data[
+                    "imperviousness_coefficient"
+                ]
+                landcover_data["land_use_type"] = landcover_data["landuse_category"]
+                landcover_data["land_use_description"] = landcover_data["landuse_description"]
 
             except Exception as e:
                 self.logger.warning(f"CORINE processing failed: {e}")
@@ -666,7 +1075,7 @@ class UHIAnalysisBackend:
         """Apply fallback values when CORINE processing fails."""
         landcover_data["land_use_type"] = "unknown"
         landcover_data["impervious_coefficient"] = 0.3
-        landcover_data["land_use_description"] = "Unknown Land Use"
+        landcover_data["land_use_description"] = "Unbekannte Landnutzung"
 
     def _generate_analysis_summary(self, processed: dict[str, Any]) -> dict[str, Any]:
         """Generate comprehensive analysis summary."""
@@ -7,15 +7,20 @@ interactive forms, real-time progress tracking, and comprehensive result
 visualization. Built with Flask and modern web technologies.
 """
 
+import hashlib
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from typing import Any
 
 from flask import Flask, jsonify, render_template, request, session
 from flask_cors import CORS
 
 from heatsense.config.settings import UHI_PERFORMANCE_MODES
-from heatsense.webapp.analysis_backend import UHIAnalysisBackend
+from heatsense.webapp.analysis_backend import UHIAnalysisBackend, iter_analysis_result
 
 # Configure Flask application
 app = Flask(__name__, template_folder="templates", static_folder="static")
@@ -31,6 +36,13 @@ logger = logging.getLogger(__name__)
 # Initialize analysis backend
 backend = UHIAnalysisBackend(log_level="INFO")
 
+# Completed analyses are reused for identical queries within a day; their GeoJSON
+# layers make results large, so only the most recently used ones are kept
+RESULT_CACHE_TTL = 24 * 3600
+RESULT_CACHE_SIZE = 32
+_result_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
 # Berlin administrative divisions for area selection
 BERLIN_DISTRICTS = [
     "Charlottenburg-Wilmersdorf",
@@ -174,6 +186,42 @@ def get_areas():
     return jsonify(area_mappings.get(area_type, BERLIN_DISTRICTS))
 
 
+def _get_result_cache_key(area: str, start_date: str, end_date: str, performance_mode: str) -> str:
+    """
+    Build the result cache key, which doubles as the weak response ETag.
+
+    Area names are matched case-insensitively by the backend, so they are normalised
+    here to let equivalent queries share one cache entry.
+    """
+    query = f"{area.strip().lower()}|{start_date}|{end_date}|{performance_mode}"
+    return hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_result(cache_key: str) -> dict[str, Any] | None:
+    """Return a cached analysis result that has not expired yet."""
+    with _result_cache_lock:
+        entry = _result_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= RESULT_CACHE_TTL:
+            del _result_cache[cache_key]
+            return None
+
+        _result_cache.move_to_end(cache_key)
+        return result
+
+
+def _store_cached_result(cache_key: str, result: dict[str, Any]) -> None:
+    """Cache a completed analysis result, evicting the least recently used ones."""
+    with _result_cache_lock:
+        _result_cache[cache_key] = (time.monotonic(), result)
+        _result_cache.move_to_end(cache_key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
 @app.route("/api/analyze", methods=["POST"])
 def analyze():
     """Execute Urban Heat Island analysis with user-specified parameters."""
@@ -217,17 +265,38 @@ def analyze():
             f"Starting UHI analysis: {area}, {start_date_parsed} to {end_date_parsed}, mode: {performance_mode}"
         )
 
-        # Execute analysis
-        result = backend.analyze(
-            area=area,
-            start_date=start_date_parsed,
-            end_date=end_date_parsed,
-            performance_mode=performance_mode,
+        # Identical queries are answered from the result cache, or with 304 Not Modified
+        # when the client already holds the result for this ETag. The ETag identifies the
+        # query rather than the bytes of the result, so it is sent as a weak validator
+        cache_key = _get_result_cache_key(
+            area, start_date_parsed, end_date_parsed, performance_mode
         )
+        result = _get_cached_result(cache_key)
+        if result is not None:
+            if request.if_none_match.contains_weak(cache_key):
+                session["analysis_status"] = result.get("status", "completed")
+                response = app.response_class(status=304)
+                response.set_etag(cache_key, weak=True)
+                return response
+            logger.info(f"Serving cached UHI analysis for {area}")
+        else:
+            # Execute analysis
+            result = backend.analyze(
+                area=area,
+                start_date=start_date_parsed,
+                end_date=end_date_parsed,
+                performance_mode=performance_mode,
+            )
+            if result.get("status") == "completed":
+                _store_cached_result(cache_key, result)
 
         session["analysis_status"] = result.get("status", "completed")
 
-        return jsonify(result)
+        # GeoJSON layers are already encoded and are streamed into the response as-is
+        response = app.response_class(iter_analysis_result(result), mimetype="application/json")
+        if result.get("status") == "completed":
+            response.set_etag(cache_key, weak=True)
+        return response
 
     except Exception as e:
         logger.error(f"Analysis execution failed: {str(e)}")
@@ -0,0 +1,87 @@
+"""Tests for hotspot identification in the Urban Heat Island analyzer."""
+
+import warnings
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import shapely
+
+from heatsense.data.urban_heat_island_analyzer import UrbanHeatIslandAnalyzer
+
+
+def _grid_with_hot_block(nan_ring: bool, size: int = 30, cell_size: float = 100.0) -> tuple:
+    """
+    Build a square grid with a warm 6x6 block in the middle and NaN cells.
+
+    NaN cells are scattered over the grid and, with ``nan_ring``, also cover the
+    ring of cells bordering the block. Returns the grid and the block and ring masks.
+    """
+    cols, rows = np.meshgrid(np.arange(size), np.arange(size), indexing="ij")
+    cols, rows = cols.ravel(), rows.ravel()
+    cells = shapely.box(
+        cols * cell_size, rows * cell_size, (cols + 1) * cell_size, (rows + 1) * cell_size
+    )
+
+    rng = np.random.default_rng(42)
+    temperatures = 20 + rng.normal(0, 0.5, len(cells))
+    offset = np.maximum(abs(cols - size / 2 + 0.5), abs(rows - size / 2 + 0.5))
+    hot = offset < 3
+    ring = (offset > 3) & (offset < 4)
+    temperatures[hot] += 6
+    # Nodata cells and failed strips are filled with NaN by temperature extraction
+    temperatures[::13] = np.nan
+    if nan_ring:
+        temperatures[ring] = np.nan
+
+    grid = gpd.GeoDataFrame(
+        {"temperature": temperatures.astype(np.float32)}, geometry=cells, crs="EPSG:25833"
+    )
+    return grid, hot, ring
+
+
+@pytest.mark.parametrize("nan_ring", [False, True])
+@pytest.mark.parametrize("permutations", [0, 999])
+def test_hotspots_are_the_warm_block_despite_nan_cells(permutations, nan_ring):
+    grid, hot, ring = _grid_with_hot_block(nan_ring)
+    analyzer = UrbanHeatIslandAnalyzer(min_cluster_size=3, hotspot_permutations=permutations)
+
+    hotspots = analyzer._identify_heat_hotspots(grid)
+
+    flagged = np.zeros(len(grid), dtype=bool)
+    flagged[hotspots.index] = True
+    has_data = grid["temperature"].notna().to_numpy()
+    assert not (flagged & ~has_data).any()
+    # Every warm cell with data is flagged; besides them only noisy cells right next to
+    # the block may be, and with a NaN ring the flagged cells are exactly the block
+    assert flagged[hot & has_data].all()
+    assert not (flagged & ~(hot | ring)).any()
+
+
+@pytest.mark.parametrize("permutations", [0, 999])
+def test_nan_cells_are_not_neighbours(permutations):
+    grid, _, _ = _grid_with_hot_block(nan_ring=False)
+    rng = np.random.default_rng(7)
+    grid.loc[rng.random(len(grid)) < 0.3, "temperature"] = np.nan
+    analyzer = UrbanHeatIslandAnalyzer(min_cluster_size=1, hotspot_permutations=permutations)
+
+    # Same statistic as on a grid where the cells without data never existed
+    with_nan = analyzer._identify_heat_hotspots(grid)
+    without_nan = analyzer._identify_heat_hotspots(grid[grid["temperature"].notna()])
+
+    assert len(with_nan) > 0
+    assert with_nan.index.tolist() == without_nan.index.tolist()
+
+
+def test_hotspots_need_three_valid_cells():
+    grid, _, _ = _grid_with_hot_block(nan_ring=False, size=3)
+    grid["temperature"] = np.float32(np.nan)
+    grid.loc[:1, "temperature"] = [20.0, 25.0]
+    analyzer = UrbanHeatIslandAnalyzer()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        hotspots = analyzer._identify_heat_hotspots(grid)
+
+    assert hotspots.empty
+    assert "cluster_id" in hotspots.columns